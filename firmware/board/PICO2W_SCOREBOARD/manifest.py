@@ -7,8 +7,12 @@
 # backend), and Bluetooth is compiled out entirely.
 #
 # App code is NOT frozen here by design: frozen modules can't be updated
-# over the air. The app ships as .mpy on littlefs today and moves to the
-# ROMFS partition (in-place execution, OTA-rewritable) next — see BACKLOG.
+# over the air. Release deploys ship the app as mpy-cross'd .mpy inside the
+# ROMFS partition instead, which already buys what freezing would at boot:
+# no source parse/compile, and bytecode plus its constant tables (e.g.
+# scoreboard/config.py's defaults literal) execute in place from flash
+# rather than being copied to the heap. Only main.py, ota.py, and
+# config.json live on littlefs (see tools/build.py _LITTLEFS_FILES).
 include("$(PORT_DIR)/boards/manifest.py")
 
 # The one piece of bundle-networking the app DOES need: `ssl` is a frozen
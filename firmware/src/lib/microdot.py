@@ -13,6 +13,14 @@ Vendored with modifications:
   few TCP sockets. Leaked sockets accumulate over days of normal use until
   inbound connections are silently dropped while the rest of the firmware
   stays healthy. Abandoned connections are now cancelled and closed.
+- The status line and headers go out as one write, together with the
+  body when it is a small ``bytes`` (at most ``send_file_buffer_size``),
+  rather than one socket write per header line.
+- File bodies stream through one shared ``bytearray`` via ``readinto``
+  (``Response._send_file_buf``) instead of allocating a fresh chunk per
+  ``read()``. Sharing is safe under asyncio: each chunk is handed to
+  ``awrite`` with no yield in between, and the stream either sends it or
+  copies it into its own buffer before suspending.
 """
 import asyncio
 import io
@@ -575,6 +583,10 @@ class Response:
 
     send_file_buffer_size = 1024
 
+    # Shared file-streaming chunk buffer, (re)allocated lazily to
+    # send_file_buffer_size (see the module docstring).
+    _send_file_buf = None
+
     #: The content type to use for responses that do not explicitly define a
     #: ``Content-Type`` header.
     default_content_type = 'text/plain'
@@ -674,19 +686,28 @@ class Response:
             # status code
             reason = self.reason if self.reason is not None else \
                 ('OK' if self.status_code == 200 else 'N/A')
-            await stream.awrite('HTTP/1.0 {status_code} {reason}\r\n'.format(
-                status_code=self.status_code, reason=reason).encode())
+            head = ['HTTP/1.0 {status_code} {reason}\r\n'.format(
+                status_code=self.status_code, reason=reason)]
 
             # headers
             for header, value in self.headers.items():
                 values = value if isinstance(value, list) else [value]
                 for value in values:
-                    await stream.awrite('{header}: {value}\r\n'.format(
-                        header=header, value=value).encode())
-            await stream.awrite(b'\r\n')
-
-            # body
-            if not self.is_head:
+                    head.append('{header}: {value}\r\n'.format(
+                        header=header, value=value))
+            head.append('\r\n')
+            head = ''.join(head).encode()
+
+            # body: a small in-memory body rides in the same write as the
+            # head (one socket send for a typical JSON API reply)
+            body = self.body
+            if self.is_head:
+                await stream.awrite(head)
+            elif isinstance(body, bytes) and \
+                    len(body) <= self.send_file_buffer_size:
+                await stream.awrite(head + body if body else head)
+            else:
+                await stream.awrite(head)
                 iter = self.body_iter()
                 async for body in iter:
                     if isinstance(body, str):  # pragma: no cover
@@ -748,10 +769,24 @@ class Response:
                     except StopIteration:
                         await self.aclose()
                         raise StopAsyncIteration
-                buf = response.body.read(response.send_file_buffer_size)
+                size = response.send_file_buffer_size
+                if hasattr(response.body, 'readinto'):
+                    shared = Response._send_file_buf
+                    if shared is None or len(shared) != size:
+                        shared = Response._send_file_buf = bytearray(size)
+                    n = response.body.readinto(shared)
+                    if iscoroutine(n):  # pragma: no cover
+                        n = await n
+                    if not n:
+                        n = 0
+                    if n < size:
+                        self.i = self.ITER_NO_BODY
+                        return memoryview(shared)[:n]
+                    return shared
+                buf = response.body.read(size)
                 if iscoroutine(buf):  # pragma: no cover
                     buf = await buf
-                if len(buf) < response.send_file_buffer_size:
+                if len(buf) < size:
                     self.i = self.ITER_NO_BODY
                 return buf
 
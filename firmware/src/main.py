@@ -139,9 +139,9 @@ import uasyncio as asyncio
 import gc
 import os
 import rp2
-import hashlib
 import _thread
 import ota
+from micropython import const
 
 # --- OTA apply-at-boot --------------------------------------------------------
 # Apply any staged app image BEFORE importing the app: at this point nothing
@@ -240,6 +240,9 @@ except ImportError as e:
 
 # Reduce buffer size for memory-constrained environment
 Response.send_file_buffer_size = 2048
+# Allocate microdot's shared file-streaming buffer now, while the heap is
+# still unfragmented, instead of on the first page load mid-churn.
+Response._send_file_buf = bytearray(Response.send_file_buffer_size)
 
 # Collect after ~48 KB of allocation instead of waiting for the heap to
 # fill: post-ROMFS churn is ~4 KB/s, so this trades a cheap collection every
@@ -315,26 +318,90 @@ def _find_index() -> str | None:
 INDEX_PATH: str | None = _find_index()
 
 
-# Compute ETag for the web bundle once at startup
+def _map_index() -> memoryview | None:
+    """Zero-copy view of the web bundle when it lives in ROMFS.
+
+    ROMFS files are memory-mapped flash and support the buffer protocol, so
+    a release deploy can serve `/` straight from flash with no file object
+    and no read buffer (see _index_chunks). Dev deploys (littlefs) return
+    None and keep streaming via send_file.
+    """
+    if INDEX_PATH is None or not INDEX_PATH.startswith('/rom/'):
+        return None
+    try:
+        return memoryview(open(INDEX_PATH, 'rb'))
+    except (OSError, TypeError):
+        return None
+
+
+INDEX_VIEW: memoryview | None = _map_index()
+INDEX_LENGTH: str = str(len(INDEX_VIEW)) if INDEX_VIEW is not None else ''
+
+
+def _index_chunks():
+    """Yield the mapped bundle as send_file_buffer_size slices of flash.
+
+    Never hand the stream the whole view: asyncio's Stream.write keeps
+    whatever the socket didn't take in `out_buf += buf[ret:]`, which would
+    copy most of the ~50 KB bundle into one contiguous heap block. Per
+    chunk, the pending remainder is at most one slice.
+    """
+    size = Response.send_file_buffer_size
+    for i in range(0, len(INDEX_VIEW), size):
+        yield INDEX_VIEW[i:i + size]
+
+
 def _compute_index_etag() -> str | None:
+    """ETag for the web bundle, taken from its gzip trailer.
+
+    Every gzip member ends with the CRC32 and size of the uncompressed
+    data, so the bundle already carries its own content fingerprint:
+    reading those 8 bytes replaces a SHA-1 pass over the whole file at boot.
+    """
     if INDEX_PATH is None:
         return None
     try:
-        h = hashlib.sha1()
-        with open(INDEX_PATH, 'rb') as f:
-            while True:
-                chunk: bytes = f.read(512)
-                if not chunk:
-                    break
-                h.update(chunk)
-        # Convert first 8 bytes to hex string (16 chars)
-        return ''.join('{:02x}'.format(b) for b in h.digest()[:8])
+        if INDEX_VIEW is not None:
+            trailer = INDEX_VIEW[-8:]
+        else:
+            with open(INDEX_PATH, 'rb') as f:
+                f.seek(-8, 2)
+                trailer = f.read(8)
+        if len(trailer) != 8:
+            return None
+        return '{:08x}{:08x}'.format(int.from_bytes(trailer[:4], 'little'),
+                                     int.from_bytes(trailer[4:], 'little'))
     except OSError:
         return None
 
 
 INDEX_ETAG: str | None = _compute_index_etag()
 
+# Conditional-GET reply, built once: Microdot copies a tuple's headers into
+# its own dict, so every 304 can share this one.
+_NOT_MODIFIED: tuple = ('', 304, {'ETag': INDEX_ETAG})
+
+# `/` response headers, rebuilt only when the configured max-age changes
+# (it is settable at runtime) rather than assembled on every request.
+_index_headers: dict | None = None
+_index_headers_max_age: int = -1
+
+
+def _get_index_headers(max_age: int) -> dict:
+    global _index_headers, _index_headers_max_age
+    if _index_headers is None or max_age != _index_headers_max_age:
+        headers = {'Content-Type': 'text/html', 'Content-Encoding': 'gzip'}
+        if INDEX_VIEW is not None:
+            headers['Content-Length'] = INDEX_LENGTH
+        if INDEX_ETAG:
+            headers['ETag'] = INDEX_ETAG
+        if max_age > 0:
+            headers['Cache-Control'] = 'max-age=' + str(max_age)
+        _index_headers = headers
+        _index_headers_max_age = max_age
+    return _index_headers
+
+
 def update_startup_display(step: int, operation: str, detail: str = '',
                            attempt: int = 0, attempts_total: int = 0) -> None:
     """Update startup progress state. The display thread renders it on its next tick."""
@@ -358,96 +425,167 @@ def _resize_setup_regions_for_qr(regions: Regions) -> None:
 app.setup_mode = False
 app.setup_reason = None  # 'no_network_configured' | 'connection_failed' | 'bad_auth' | None
 
+# Network interfaces, set once the matching mode comes up. Initialized here
+# so routes read plain attributes instead of getattr(..., None) probes.
+app.ap = None    # AP interface (setup mode)
+app.wlan = None  # STA interface (connected)
+
+
+# statvfs cache: littlefs computes free space by walking its block
+# allocation state, and flash usage only moves on rare writes (config
+# save, log flush, OTA) — a reading this old is plenty for the status page.
+_STATVFS_TTL_MS = const(30_000)
+_flash_used: int = 0
+_flash_free: int = 0
+_statvfs_ms: int | None = None
+
+# Largest-free-block probe cache. Total free bytes hide fragmentation: a
+# MemoryError comes from lacking one contiguous run, not from lacking bytes.
+# MicroPython has no API for the largest free block, so it is measured by
+# bisecting trial allocations down to _HEAP_PROBE_STEP. That is too costly
+# to repeat on every status poll, so a reading is reused for the TTL.
+# Core 1 allocates every frame (no GIL on rp2), so a trial must never take
+# the heap near empty: the probe leaves _HEAP_PROBE_RESERVE free and stops
+# at _HEAP_PROBE_CAP (room for the ~33 KB TLS buffers). Each trial still
+# counts toward the 48 KB gc.threshold, so a probe can bring the next
+# collection forward on either core. The reading is a lower bound, and it
+# can be up to _HEAP_PROBE_TTL_MS stale while Core 1 keeps allocating.
+_HEAP_PROBE_TTL_MS = const(30_000)
+_HEAP_PROBE_STEP = const(1024)
+_HEAP_PROBE_RESERVE = const(16 * 1024)
+_HEAP_PROBE_CAP = const(40 * 1024)
+_largest_free: int = 0
+_largest_free_ms: int | None = None
+
+
+def _probe_largest_free(limit: int) -> int:
+    """Largest single allocation (to _HEAP_PROBE_STEP) that fits, <= limit."""
+    # Usual case: the whole limit fits in one trial, no bisecting needed
+    try:
+        buf = bytearray(limit)
+        buf = None
+        return limit
+    except MemoryError:
+        pass
+    lo, hi = 0, limit
+    while hi - lo > _HEAP_PROBE_STEP:
+        mid = (lo + hi) // 2
+        try:
+            buf = bytearray(mid)
+            buf = None
+            lo = mid
+        except MemoryError:
+            hi = mid
+    return lo
 
-def get_memory_stats() -> dict:
-    """Get current memory usage statistics.
+
+def get_memory_stats(out: dict) -> None:
+    """Write current memory usage statistics into `out`.
 
     Deliberately does NOT gc.collect() first: observing memory must not
     change runtime behavior. The reading therefore includes garbage
     accumulated since the last automatic collection — expect a sawtooth
     that climbs and drops; the drops are MicroPython's GC doing its job.
+    Flash figures come from a statvfs reading at most _STATVFS_TTL_MS old.
+
+    The one exception is memory_largest_free: its probe allocates (bounded,
+    see _HEAP_PROBE_CAP), and a failed trial allocation makes the GC
+    collect before raising. That is why it is rate-limited to once per
+    _HEAP_PROBE_TTL_MS.
     """
+    global _flash_used, _flash_free, _statvfs_ms, _largest_free, _largest_free_ms
     memory_used = gc.mem_alloc()
     memory_free = gc.mem_free()
 
-    # Flash filesystem usage via statvfs
-    stat = os.statvfs('/')
-    block_size = stat[0]
-    total_blocks = stat[2]
-    free_blocks = stat[3]
-    flash_total = block_size * total_blocks
-    flash_free = block_size * free_blocks
-    flash_used = flash_total - flash_free
+    now = time.ticks_ms()
+    if _largest_free_ms is None or time.ticks_diff(now, _largest_free_ms) >= _HEAP_PROBE_TTL_MS:
+        _largest_free = _probe_largest_free(
+            max(0, min(memory_free - _HEAP_PROBE_RESERVE, _HEAP_PROBE_CAP)))
+        _largest_free_ms = now
 
-    return {
-        'memory_used': memory_used,
-        'memory_free': memory_free,
-        'flash_used': flash_used,
-        'flash_free': flash_free
-    }
+    # Flash filesystem usage via statvfs (f_bsize, f_blocks, f_bfree),
+    # cached already converted to bytes
+    if _statvfs_ms is None or time.ticks_diff(now, _statvfs_ms) >= _STATVFS_TTL_MS:
+        stat = os.statvfs('/')
+        _flash_free = stat[0] * stat[3]
+        _flash_used = stat[0] * stat[2] - _flash_free
+        _statvfs_ms = now
+
+    out['memory_used'] = memory_used
+    out['memory_free'] = memory_free
+    out['memory_largest_free'] = _largest_free
+    out['flash_used'] = _flash_used
+    out['flash_free'] = _flash_free
+
+
+# get_network_status memo. The settings page polls /api/status on an
+# interval (one poller per open tab); polls landing inside this window reuse
+# the last snapshot rather than re-reading statvfs and rebuilding the dict.
+_STATUS_TTL_MS = const(1000)
+_status_cache_ms: int | None = None
+
+# The one /api/status dict. Each refresh rewrites it in place rather than
+# allocating a new 15-key dict; Microdot serializes it before returning to
+# the event loop, so no reader ever sees a half-rewritten payload.
+_status: dict = {}
 
 
 def get_network_status() -> dict:
-    """Build current network status dict for API."""
-    ap = getattr(app, 'ap', None)
-    wlan = getattr(app, 'wlan', None)
-    setup_mode = getattr(app, 'setup_mode', False)
-    setup_reason = getattr(app, 'setup_reason', None)
+    """Current network status dict for API, refreshed at most every
+    _STATUS_TTL_MS.
 
-    # Get memory stats (same for all modes)
-    memory = get_memory_stats()
+    The returned dict is shared and rewritten in place on refresh — read
+    it, don't mutate it or hold on to it (Microdot only serializes it).
+    """
+    global _status_cache_ms
+    now = time.ticks_ms()
+    if _status_cache_ms is None or time.ticks_diff(now, _status_cache_ms) >= _STATUS_TTL_MS:
+        _refresh_network_status(_status)
+        _status_cache_ms = now
+    return _status
+
+
+# Shared shape of every /api/status payload (the 'unknown' mode values).
+# _refresh_network_status resets to it and overwrites only what the current
+# mode sets, instead of spelling out three near-identical 14-key literals.
+_STATUS_TEMPLATE: dict = {
+    'mode': 'unknown',
+    'connected': False,
+    'setup_mode': False,
+    'setup_reason': None,
+    'configured_ssid': None,
+    'ip': None,
+    'hostname': None,
+    'ap_ip': None,
+    'ap_ssid': None,
+    'app_version': APP_VERSION,
+}
+
+
+def _refresh_network_status(status: dict) -> None:
+    """Rewrite `status` in place with the current network status for API."""
+    ap = app.ap
+    wlan = app.wlan
+
+    status.update(_STATUS_TEMPLATE)
+    # Memory stats (same for all modes)
+    get_memory_stats(status)
 
     if ap and ap.active():
-        return {
-            'mode': 'ap',
-            'connected': False,
-            'setup_mode': setup_mode,
-            'setup_reason': setup_reason,
-            'configured_ssid': config.ssid if setup_reason in ('connection_failed', 'bad_auth') else None,
-            'ip': None,
-            'hostname': None,
-            'ap_ip': ap.ifconfig()[0],
-            'ap_ssid': config.device_name,
-            'memory_used': memory['memory_used'],
-            'memory_free': memory['memory_free'],
-            'flash_used': memory['flash_used'],
-            'flash_free': memory['flash_free'],
-            'app_version': APP_VERSION
-        }
+        setup_reason = app.setup_reason
+        status['mode'] = 'ap'
+        status['setup_mode'] = app.setup_mode
+        status['setup_reason'] = setup_reason
+        if setup_reason in ('connection_failed', 'bad_auth'):
+            status['configured_ssid'] = config.ssid
+        # get_my_hosts' cached (name.local, name, ap_ip): no ifconfig() call
+        status['ap_ip'] = get_my_hosts(ap)[2]
+        status['ap_ssid'] = config.device_name
     elif wlan and wlan.isconnected():
-        return {
-            'mode': 'station',
-            'connected': True,
-            'setup_mode': False,
-            'setup_reason': None,
-            'configured_ssid': None,
-            'ip': wlan.ifconfig()[0],
-            'hostname': f'{config.device_name}.local',
-            'ap_ip': None,
-            'ap_ssid': None,
-            'memory_used': memory['memory_used'],
-            'memory_free': memory['memory_free'],
-            'flash_used': memory['flash_used'],
-            'flash_free': memory['flash_free'],
-            'app_version': APP_VERSION
-        }
-    else:
-        return {
-            'mode': 'unknown',
-            'connected': False,
-            'setup_mode': False,
-            'setup_reason': None,
-            'configured_ssid': None,
-            'ip': None,
-            'hostname': None,
-            'ap_ip': None,
-            'ap_ssid': None,
-            'memory_used': memory['memory_used'],
-            'memory_free': memory['memory_free'],
-            'flash_used': memory['flash_used'],
-            'flash_free': memory['flash_free'],
-            'app_version': APP_VERSION
-        }
+        status['mode'] = 'station'
+        status['connected'] = True
+        status['ip'] = wlan.ifconfig()[0]
+        status['hostname'] = get_my_hosts(ap)[0]
 
 
 async def _sync_time_from_backend() -> int | None:
@@ -493,53 +631,94 @@ api: Microdot = create_api(config, get_network_status)
 app.mount(api, url_prefix='/api')
 
 
-def get_my_hosts(ap: network.WLAN | None) -> set:
+# get_my_hosts cache: the hostnames plus the inputs they were built from.
+# Both inputs change rarely (device name via PUT /config, AP once at setup),
+# so the captive-portal check normally allocates nothing per request.
+_my_hosts: tuple = ()
+_my_hosts_key: tuple | None = None
+
+
+def get_my_hosts(ap: network.WLAN | None) -> tuple:
     """
-    Get the set of hostnames that belong to us.
-    Built dynamically from config and the provided AP interface.
+    Get the hostnames that belong to us.
+    Built from config and the provided AP interface, and rebuilt only when
+    the device name or AP interface changes. A tuple rather than a set: with
+    at most three entries, `host in hosts` is a few direct string compares
+    and needs no hash table.
     """
-    hosts: set = set()
+    global _my_hosts, _my_hosts_key
+    name = config.device_name
+    key = _my_hosts_key
+    if key is not None and key[0] == name and key[1] is ap:
+        return _my_hosts
+
+    # Configured device name (e.g., "scoreboard.local"); some clients
+    # might omit .local. Then the AP IP address.
+    if ap:
+        _my_hosts = (f"{name}.local", name, ap.ifconfig()[0])
+    else:
+        _my_hosts = (f"{name}.local", name)
+    _my_hosts_key = (name, ap)
+    return _my_hosts
 
-    # Add configured device name (e.g., "scoreboard.local")
-    hosts.add(f"{config.device_name}.local")
-    hosts.add(config.device_name)  # Some clients might omit .local
 
-    # Add AP IP address
-    if ap:
-        hosts.add(ap.ifconfig()[0])
+def _redirect_response(ip: str) -> tuple:
+    """Captive-portal 302 (body, status, headers) to the setup page on `ip`."""
+    return '', 302, {'Location': 'http://' + ip + '/#/setup'}
+
+
+# Built once (here, then again when the AP comes up) and returned as-is by
+# every hijacked request: Microdot copies response headers into its own
+# dict, so the shared one is never mutated.
+app.redirect_response = _redirect_response('192.168.4.1')
+
 
-    return hosts
+def _request_host(request: Request) -> str:
+    """Host header without any port. Captive-portal probes normally carry
+    no port, and str.find lets that case return the header untouched —
+    no list, tuple, or substring allocated."""
+    host = request.headers.get('Host', '')
+    colon = host.find(':')
+    if colon >= 0:
+        host = host[:colon]
+    return host
 
 
 @app.get('/')
 async def index(request: Request) -> Response | tuple:
     """Serve the SPA, or redirect hijacked requests to trigger captive portal."""
-    ap = getattr(app, 'ap', None)
-    host = request.headers.get('Host', '').split(':')[0]
+    ap = app.ap
+    host = _request_host(request)
 
     # If this is a hijacked request (DNS lie), redirect to setup page to trigger portal
     if ap and host not in get_my_hosts(ap):
-        redirect_ip = ap.ifconfig()[0]
-        return '', 302, {'Location': f'http://{redirect_ip}/#/setup'}
+        return app.redirect_response
 
     # Check for conditional request (304 Not Modified)
     if INDEX_ETAG and request.headers.get('If-None-Match') == INDEX_ETAG:
-        return '', 304, {'ETag': INDEX_ETAG}
+        return _NOT_MODIFIED
 
     if INDEX_PATH is None:
         return 'Web bundle missing - redeploy the app', 500
 
-    response = send_file(INDEX_PATH, content_type='text/html', compressed='gzip')
+    headers = _get_index_headers(config.cache_max_age_seconds)
+    if INDEX_VIEW is not None:
+        return Response(_index_chunks(), headers=headers)
 
-    # Add caching headers
+    # Dev deploy (littlefs): stream the file, then add the caching headers
+    response = send_file(INDEX_PATH, content_type='text/html', compressed='gzip')
     if INDEX_ETAG:
         response.headers['ETag'] = INDEX_ETAG
-    if config.cache_max_age_seconds > 0:
-        response.headers['Cache-Control'] = f'max-age={config.cache_max_age_seconds}'
-
+    cache_control = headers.get('Cache-Control')
+    if cache_control:
+        response.headers['Cache-Control'] = cache_control
     return response
 
 
+# catch_all's reply for our own hosts, shared like the redirect tuple above.
+_NOT_FOUND: tuple = ('Not found', 404)
+
+
 @app.route('/<path:path>')
 async def catch_all(request: Request, path: str) -> tuple:
     """
@@ -547,24 +726,24 @@ async def catch_all(request: Request, path: str) -> tuple:
     - Legitimate requests (Host is our IP/hostname) -> 404
     - Hijacked requests (Host is external domain) -> redirect to portal
     """
-    ap = getattr(app, 'ap', None)  # Get AP from app object
-    host = request.headers.get('Host', '').split(':')[0]  # strip port if present
+    ap = app.ap
+    host = _request_host(request)
 
     if host in get_my_hosts(ap):
-        return 'Not found', 404  # Legit request for path that doesn't exist
+        return _NOT_FOUND  # Legit request for path that doesn't exist
 
     # Hijacked request (DNS lie) -> redirect to setup page to trigger captive portal
-    redirect_ip = ap.ifconfig()[0] if ap else '192.168.4.1'
-    return '', 302, {'Location': f'http://{redirect_ip}/#/setup'}
+    return app.redirect_response
 
 
-def start_ap_mode() -> network.WLAN:
+async def start_ap_mode() -> network.WLAN:
     """
     Start Access Point mode for initial setup.
 
     Creates an open WiFi network that users can connect to
     for configuring the device. Stores the AP interface on the
     app object so routes can access it for captive portal logic.
+    Bring-up is awaited, not spun on, so other Core 0 tasks keep running.
 
     Returns:
         The AP WLAN interface
@@ -573,31 +752,63 @@ def start_ap_mode() -> network.WLAN:
     ap.config(essid=config.device_name, security=0)  # security=0 means open network
     ap.active(True)
 
+    # Unbounded on purpose: setup mode is useless without the AP, and the
+    # old blocking loop waited just as long — it just starved the loop.
     while not ap.active():
-        machine.idle()  # Low-power wait instead of hot loop
+        await asyncio.sleep_ms(20)
 
     app.ap = ap  # Store on app object for routes to access
+    app.redirect_response = _redirect_response(ap.ifconfig()[0])
     logger.debug(f"[WIFI] ap mode started: ssid={config.device_name}")
     logger.debug(f"[WIFI] ap ip: {ap.ifconfig()[0]}")
     return ap
 
 
+# CYW43 link status codes start_station_mode acts on (wlan.status()).
+_LINK_BADAUTH = const(-3)
+_LINK_FAIL = const(-1)
+_LINK_NOIP = const(2)
+
+# start_station_mode tuning: full reset+connect attempts, the connect wait's
+# poll interval (starts fast, doubles up to the cap, and drops back to the
+# minimum on every status change so transitions are caught promptly), and
+# the extra time granted once association succeeded and only DHCP remains
+# (LINK_NOIP).
+_WIFI_MAX_RETRIES = const(3)
+_WIFI_POLL_MIN_MS = const(50)
+_WIFI_POLL_MAX_MS = const(500)
+_WIFI_NOIP_EXTENSION_MS = const(15_000)
+# Pause before retry n is this << (n - 1) (2 s, then 4 s): lets an access
+# point that just refused or dropped an association settle before the next
+# full reset, without noticeably delaying the fall back to setup mode.
+_WIFI_RETRY_BACKOFF_MS = const(1000)
+
+# WLAN status names for codes -3..3, indexed by status + 3.
+_WLAN_STATUS_NAMES = (
+    "LINK_BADAUTH (wrong password)",
+    "LINK_NONET (SSID not found)",
+    "LINK_FAIL",
+    "LINK_DOWN",
+    "LINK_JOIN",
+    "LINK_NOIP",
+    "LINK_UP",
+)
+
+
 def get_wlan_status_string(status: int) -> str:
     """Convert WLAN status code to human-readable string."""
-    status_map: dict = {
-        0: "LINK_DOWN",
-        1: "LINK_JOIN",
-        2: "LINK_NOIP",
-        3: "LINK_UP",
-        -1: "LINK_FAIL",
-        -2: "LINK_NONET (SSID not found)",
-        -3: "LINK_BADAUTH (wrong password)",
-    }
-    return status_map.get(status, f"UNKNOWN({status})")
-
-
-def reset_wlan(wlan: network.WLAN) -> None:
-    """Full reset of WLAN interface to clear stale state."""
+    if -3 <= status <= 3:
+        return _WLAN_STATUS_NAMES[status + 3]
+    return f"UNKNOWN({status})"
+
+
+async def reset_wlan(wlan: network.WLAN) -> None:
+    """Full reset of WLAN interface to clear stale state.
+
+    Waits yield to the event loop. Only the power-down pause is a fixed
+    delay (the chip exposes no "off" signal); bring-up polls active()
+    instead of sleeping a worst-case second.
+    """
     logger.debug("[WIFI] reset attempt: deinit -> reinit, pm=0xa11140")
     try:
         wlan.disconnect()
@@ -610,27 +821,31 @@ def reset_wlan(wlan: network.WLAN) -> None:
     except:
         pass
 
-    time.sleep(1)  # Allow chip to fully power down
+    await asyncio.sleep_ms(1000)  # Allow chip to fully power down
 
-    # Re-initialize
+    # Re-initialize, then wait (bounded) for the interface to report up
     wlan.active(True)
-    time.sleep(1)
+    for _ in range(50):
+        if wlan.active():
+            break
+        await asyncio.sleep_ms(20)
 
-    # Use documented power management disable value
+    # Use documented power management disable value. A synchronous ioctl:
+    # the old trailing 0.5 s settle after it bought nothing.
     try:
         wlan.config(pm=0xa11140)
     except:
         pass
 
-    time.sleep(0.5)
 
-
-def start_station_mode() -> network.WLAN | None:
+async def start_station_mode() -> network.WLAN | None:
     """
     Connect to configured WiFi network.
 
     Sets the hostname before connecting to enable mDNS discovery.
-    Falls back to AP mode if connection times out.
+    Falls back to AP mode if connection times out. The connect wait yields
+    to the event loop, so tasks started before it (log flush, auto
+    brightness) keep running during the 15-60 s bring-up.
 
     Returns:
         The STA WLAN interface if connected, None if timed out
@@ -645,95 +860,109 @@ def start_station_mode() -> network.WLAN | None:
     network.hostname(config.device_name)
     wlan = network.WLAN(network.STA_IF)
 
-    max_retries = 3
     # Per-attempt timeout comes from config; NOIP extension grants extra time
     # once association succeeded and only DHCP remains.
-    per_attempt_timeout = config.connect_timeout_seconds
-    noip_extension = 15  # Extra time if we reach LINK_NOIP state
+    per_attempt_timeout_ms = config.connect_timeout_seconds * 1000
 
-    for attempt in range(1, max_retries + 1):
-        logger.debug(f"[WIFI] connection attempt: {attempt}/{max_retries}")
-
-        # Full reset before each attempt
-        reset_wlan(wlan)
+    for attempt in range(1, _WIFI_MAX_RETRIES + 1):
+        logger.debug(f"[WIFI] connection attempt: {attempt}/{_WIFI_MAX_RETRIES}")
 
         # Retries never move the step counter backward (set_startup_step is
         # monotonic); attempts >1 read as "Retry n/3" plus the attempt dots.
-        scan_op = "WiFi scan" if attempt == 1 else f"Retry {attempt}/{max_retries}"
-        connect_op = "Connecting" if attempt == 1 else f"Retry {attempt}/{max_retries}"
+        connect_op = "Connecting" if attempt == 1 else f"Retry {attempt}/{_WIFI_MAX_RETRIES}"
 
-        # Scan for available networks
-        logger.debug("[WIFI] scan started")
-        update_startup_display(2, scan_op, "Scanning...", attempt, max_retries)
-        target_found = False
-        try:
-            networks = wlan.scan()
-            update_startup_display(2, scan_op, f"Found {len(networks)}", attempt, max_retries)
-            for net in networks:
-                ssid = net[0].decode('utf-8', 'replace')
-                if ssid == config.ssid:
-                    target_found = True
-            logger.debug(f"[WIFI] scan complete: found={len(networks)}, target_visible={target_found}")
-        except Exception as e:
-            logger.error(f"[WIFI] scan failed: {e}")
-            update_startup_display(2, scan_op, "Scan failed", attempt, max_retries)
+        if attempt > 1:
+            update_startup_display(2, connect_op, "Waiting", attempt, _WIFI_MAX_RETRIES)
+            await asyncio.sleep_ms(_WIFI_RETRY_BACKOFF_MS << (attempt - 1))
+
+        # Full reset before each attempt
+        update_startup_display(2, "WiFi" if attempt == 1 else connect_op, "Resetting",
+                               attempt, _WIFI_MAX_RETRIES)
+        await reset_wlan(wlan)
+
+        # Scan only before a retry: it blocks the loop for seconds inside the
+        # driver and only feeds diagnostics (is the SSID even visible?), so
+        # the first attempt -- the one a normal boot succeeds on -- connects
+        # straight away.
+        if attempt > 1:
+            logger.debug("[WIFI] scan started")
+            update_startup_display(2, connect_op, "Scanning...", attempt, _WIFI_MAX_RETRIES)
+            try:
+                networks = wlan.scan()
+                target = config.ssid.encode()
+                target_found = False
+                for net in networks:
+                    if net[0] == target:
+                        target_found = True
+                        break
+                update_startup_display(2, connect_op, f"Found {len(networks)}", attempt, _WIFI_MAX_RETRIES)
+                logger.debug(f"[WIFI] scan complete: found={len(networks)}, target_visible={target_found}")
+            except Exception as e:
+                logger.error(f"[WIFI] scan failed: {e}")
+                update_startup_display(2, connect_op, "Scan failed", attempt, _WIFI_MAX_RETRIES)
 
         logger.debug(f"[WIFI] connecting to ssid={config.ssid}")
         # Show SSID in detail line (up to 20 chars)
         ssid_display = config.ssid[:20] if len(config.ssid) > 20 else config.ssid
-        update_startup_display(3, connect_op, ssid_display, attempt, max_retries)
+        update_startup_display(3, connect_op, ssid_display, attempt, _WIFI_MAX_RETRIES)
 
         wlan.connect(config.ssid, config.password)
 
-        start = time.time()
+        start_ms = time.ticks_ms()
         last_status = None
+        poll_ms = _WIFI_POLL_MIN_MS
+        # Raw status codes (small ints: no per-entry heap object); names are
+        # only rendered for the success log line.
         status_history = []
         reached_noip = False
         retry_connect_count = 0
 
         while not wlan.isconnected():
-            elapsed = time.time() - start
+            elapsed_ms = time.ticks_diff(time.ticks_ms(), start_ms)
             status = wlan.status()
 
             # Track status changes for summary output
             if status != last_status:
-                status_history.append(get_wlan_status_string(status))
+                status_history.append(status)
                 last_status = status
+                poll_ms = _WIFI_POLL_MIN_MS
 
                 # Track if we've reached LINK_NOIP (connected, waiting for DHCP)
-                if status == 2:  # LINK_NOIP
+                if status == _LINK_NOIP:
                     reached_noip = True
 
             # Handle BADAUTH - break to try next attempt
-            if status == -3:  # LINK_BADAUTH
+            if status == _LINK_BADAUTH:
                 logger.error("[WIFI] auth failed: bad_auth detected, clearing password")
                 app.setup_reason = "bad_auth"
-                time.sleep(1)
+                await asyncio.sleep_ms(1000)
                 break
 
             # Handle early LINK_FAIL - retry connect within same attempt
-            if status == -1 and elapsed < 5 and retry_connect_count < 2:
+            if status == _LINK_FAIL and elapsed_ms < 5000 and retry_connect_count < 2:
                 retry_connect_count += 1
                 logger.debug(f"[WIFI] early fail retry: attempt={retry_connect_count}/2")
                 wlan.connect(config.ssid, config.password)
-                time.sleep(1)
+                await asyncio.sleep_ms(1000)
                 continue
 
             # Calculate effective timeout (extended if we're in NOIP state)
-            effective_timeout = per_attempt_timeout
+            effective_timeout_ms = per_attempt_timeout_ms
             if reached_noip:
-                effective_timeout = per_attempt_timeout + noip_extension
+                effective_timeout_ms = per_attempt_timeout_ms + _WIFI_NOIP_EXTENSION_MS
 
-            if elapsed > effective_timeout:
+            if elapsed_ms > effective_timeout_ms:
                 break
 
-            time.sleep(0.5)
+            await asyncio.sleep_ms(poll_ms)
+            poll_ms = min(poll_ms * 2, _WIFI_POLL_MAX_MS)
 
         # Check for successful connection with valid IP
         if wlan.isconnected():
             ip = wlan.ifconfig()[0]
             if ip and ip != '0.0.0.0':
-                status_str = ' -> '.join(status_history) if status_history else 'DIRECT'
+                status_str = (' -> '.join(get_wlan_status_string(s) for s in status_history)
+                              if status_history else 'DIRECT')
                 logger.debug(f"[WIFI] status: {status_str}")
                 logger.debug(f"[WIFI] connected: ip={ip}")
                 logger.debug(f"[WIFI] hostname: {config.device_name}.local")
@@ -744,12 +973,24 @@ def start_station_mode() -> network.WLAN | None:
                 logger.debug("[WIFI] connected but no valid ip, retrying")
 
     # All retries exhausted
-    logger.error(f"[WIFI] all attempts failed: {max_retries} retries exhausted")
+    logger.error(f"[WIFI] all attempts failed: {_WIFI_MAX_RETRIES} retries exhausted")
     update_startup_display(4, "WiFi", "FAILED")
     wlan.active(False)
     return None
 
 
+def _display_thread_main(display: Hub75Display, writer: FontWriter, regions: Regions,
+                         health: ThreadHealth) -> None:
+    """Core 1 entry point: run the render loop, recording a crash in `health`."""
+    try:
+        health.healthy = True
+        logger.debug("[DISPLAY] thread started: core=1")
+        run_display_thread(display, writer, regions, health)
+    except Exception as e:
+        logger.error(f"[DISPLAY] thread crashed: {type(e).__name__}: {e}")
+        health.healthy = False
+
+
 def start_display_thread(display: Hub75Display, writer: FontWriter, regions: Regions,
                          health: ThreadHealth) -> None:
     """
@@ -764,16 +1005,7 @@ def start_display_thread(display: Hub75Display, writer: FontWriter, regions: Reg
         regions: Pre-allocated framebuffer regions for all text slots
         health: Shared health signals the watchdog feeder monitors
     """
-    def wrapper():
-        try:
-            health.healthy = True
-            logger.debug("[DISPLAY] thread started: core=1")
-            run_display_thread(display, writer, regions, health)
-        except Exception as e:
-            logger.error(f"[DISPLAY] thread crashed: {type(e).__name__}: {e}")
-            health.healthy = False
-
-    _thread.start_new_thread(wrapper, ())
+    _thread.start_new_thread(_display_thread_main, (display, writer, regions, health))
 
 
 # Set by watchdog_feeder when armed; ota_check_task feeds it during the
@@ -1093,11 +1325,16 @@ async def main(regions: Regions, driver: Hub75Driver, health: ThreadHealth, ligh
     # Start auto-brightness (runs in all modes)
     asyncio.create_task(auto_brightness_loop(driver, config, light_sensor))
 
+    # Every other long-lived task is queued here and only spawned after the
+    # boot garbage is swept below, so their Task objects land side by side
+    # in a clean heap instead of between dead WiFi/time-sync allocations.
+    tasks = []
+
     if not config.ssid:
         # No network configured - fresh setup mode
         app.setup_mode = True
         app.setup_reason = "no_network_configured"
-        ap = start_ap_mode()
+        ap = await start_ap_mode()
         ap_ip = ap.ifconfig()[0]
         logger.debug(f"[MAIN] mode change: startup -> setup (reason=no_network_configured, ap_ssid={config.device_name}, ap_ip={ap_ip})")
         # Explicit transition: startup → setup
@@ -1107,17 +1344,17 @@ async def main(regions: Regions, driver: Hub75Driver, health: ThreadHealth, ligh
             ap_ip=ap_ip
         )
         _resize_setup_regions_for_qr(regions)
-        asyncio.create_task(run_dns_server(ap_ip))
+        tasks.append(run_dns_server(ap_ip))
     else:
         # Try to connect to configured network
-        wlan = start_station_mode()
+        wlan = await start_station_mode()
         if wlan is None:
             # Connection failed - emergency setup mode
             app.setup_mode = True
             # app.setup_reason may already be set to "bad_auth" from the connection loop
             if app.setup_reason is None:
                 app.setup_reason = "connection_failed"
-            ap = start_ap_mode()
+            ap = await start_ap_mode()
             ap_ip = ap.ifconfig()[0]
             logger.debug(f"[MAIN] mode change: startup -> setup (reason={app.setup_reason}, ap_ssid={config.device_name}, ap_ip={ap_ip})")
             # Explicit transition: startup → setup
@@ -1128,7 +1365,7 @@ async def main(regions: Regions, driver: Hub75Driver, health: ThreadHealth, ligh
                 wifi_ssid=config.ssid
             )
             _resize_setup_regions_for_qr(regions)
-            asyncio.create_task(run_dns_server(ap_ip))
+            tasks.append(run_dns_server(ap_ip))
         else:
             # Normal operation - sync time then start services
             app.setup_mode = False
@@ -1148,18 +1385,18 @@ async def main(regions: Regions, driver: Hub75Driver, health: ThreadHealth, ligh
             # omits local start times rather than show a wrong-tz one.
             sources = sources_from_config(config)
             poller = GamePoller(config, api_client, logo_pool, sources, utc_offset)
-            asyncio.create_task(poller.run())
-            logger.debug(f"[MAIN] game poller task started ({len(sources)} league sources)")
+            tasks.append(poller.run())
+            logger.debug(f"[MAIN] game poller task queued ({len(sources)} league sources)")
 
             # OTA app-update checks need the network; station mode only
-            asyncio.create_task(ota_check_task(config))
+            tasks.append(ota_check_task(config))
 
             # Physical buttons drive the poller (skip / rotation lock) and
             # the league menu, routed through one controller.
             btn_skip, btn_lock = init_buttons()
             if btn_skip is not None and btn_lock is not None:
                 controller = MenuController(poller, sources)
-                asyncio.create_task(button_input_loop(controller, btn_skip, btn_lock))
+                tasks.append(button_input_loop(controller, btn_skip, btn_lock))
 
     # The app reached an interactive state (idle rotation or setup portal):
     # this boot was not a crash, so the crash-loop counter starts over.
@@ -1169,10 +1406,19 @@ async def main(regions: Regions, driver: Hub75Driver, health: ThreadHealth, ligh
     # behind us — from here on, everything is cooperative tasks the feeder
     # can vouch for. The boot/WiFi phase stays unprotected by design.
     if config.watchdog_enabled:
-        asyncio.create_task(watchdog_feeder(config, health))
+        tasks.append(watchdog_feeder(config, health))
     else:
         logger.debug("[WD] hardware watchdog disabled (config watchdog.enabled=false)")
 
+    # Sweep the boot phase's garbage (WiFi bring-up, time sync, QR, startup
+    # strings) in one go before serving, so the first requests and the
+    # poller's TLS buffers allocate into a clean heap rather than between
+    # dead startup objects.
+    gc.collect()
+    for coro in tasks:
+        asyncio.create_task(coro)
+    tasks = None
+
     # The web server must never take Core 0 down with it: retry on exit or
     # exception. A genuinely wedged loop is the watchdog's job, not ours.
     while True:
@@ -2,9 +2,10 @@
 Over-the-air app updates via the ROMFS partition.
 
 DEPENDENCY-FREE BY DESIGN: this module lives on littlefs (never in ROMFS)
-and uses only built-in modules (socket, ssl, json, hashlib, vfs, machine,
-os, time, network). It must keep working when the ROMFS partition — and
-therefore the entire app, including the vendored aiohttp — is corrupt.
+and uses only built-in modules (socket, ssl, json, hashlib, binascii, vfs,
+machine, os, time, network). It must keep working when the ROMFS
+partition — and therefore the entire app, including the vendored
+aiohttp — is corrupt.
 
 The app's identity is the sha256 of its ROMFS image:
   - /app_version   sha of the image currently in the partition
@@ -29,6 +30,7 @@ Synchronous on purpose: the download blocks Core 0 for ~10 s once a day;
 Core 1 keeps rendering the game throughout.
 """
 
+import binascii
 import hashlib
 import json
 import machine
@@ -90,7 +92,7 @@ def _meta_headers():
     except Exception:
         pass
     try:
-        meta["X-Device-Id"] = "".join("%02x" % b for b in machine.unique_id())
+        meta["X-Device-Id"] = binascii.hexlify(machine.unique_id()).decode()
     except Exception:
         pass
     try:
@@ -213,7 +215,7 @@ def _file_sha256(path):
             if not got:
                 break
             h.update(mv[:got])
-    return "".join("%02x" % b for b in h.digest())
+    return binascii.hexlify(h.digest()).decode()
 
 
 # --------------------------------------------------------------------------
@@ -290,7 +292,7 @@ def check_and_stage(api_url, api_key, tick=None, progress=None, context="check")
     finally:
         s.close()
 
-    got_sha = "".join("%02x" % b for b in h.digest())
+    got_sha = binascii.hexlify(h.digest()).decode()
     if got_sha != new_sha:
         _remove(STAGING_FILE)
         raise OSError("staged sha %s != manifest %s" % (got_sha[:12], new_sha[:12]))
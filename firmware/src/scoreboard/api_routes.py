@@ -18,6 +18,20 @@ from scoreboard.state import (
     update_screen_variants, update_show_dividers, update_scroll_speed
 )
 
+# Live-apply hooks for the display section, keyed by the config field that
+# triggers each. Walked in order after a PUT /config so one loop replaces a
+# chain of per-field branches; each updater owns its own driver null-check
+# and log line.
+_DISPLAY_UPDATERS = (
+    ('data_frequency_khz', update_display_frequency),
+    ('target_refresh_rate', update_display_refresh_rate),
+    ('gamma', update_display_gamma),
+    ('blanking_time_ns', update_display_blanking_time),
+    ('variants', update_screen_variants),
+    ('show_dividers', update_show_dividers),
+    ('scroll_speed_px_per_sec', update_scroll_speed),
+)
+
 def create_api(config: Config, get_network_status: "Callable[[], dict]") -> Microdot:
     """
     Create API sub-application.
@@ -49,21 +63,11 @@ def create_api(config: Config, get_network_status: "Callable[[], dict]") -> Micr
         if 'colors' in data:
             update_ui_colors(config)
         # Update display driver settings as needed
-        if 'display' in data:
-            if 'data_frequency_khz' in data['display']:
-                update_display_frequency(config)
-            if 'target_refresh_rate' in data['display']:
-                update_display_refresh_rate(config)
-            if 'gamma' in data['display']:
-                update_display_gamma(config)
-            if 'blanking_time_ns' in data['display']:
-                update_display_blanking_time(config)
-            if 'variants' in data['display']:
-                update_screen_variants(config)
-            if 'show_dividers' in data['display']:
-                update_show_dividers(config)
-            if 'scroll_speed_px_per_sec' in data['display']:
-                update_scroll_speed(config)
+        display = data.get('display')
+        if display:
+            for key, apply in _DISPLAY_UPDATERS:
+                if key in display:
+                    apply(config)
         return config.raw
 
     @api.get('/status')
@@ -6,6 +6,8 @@ The config file is stored at the root of the Pico filesystem.
 """
 
 import json
+import os
+from micropython import const
 from hub75 import gamma
 # Module-path import (not `from scoreboard import logger`): config is itself
 # imported during the scoreboard package's __init__, and binding the submodule
@@ -23,97 +25,111 @@ _WDT_TIMEOUT_MAX_MS = 8300
 # Default config path on Pico filesystem
 CONFIG_PATH = "/config.json"
 
-# Default configuration values
-_DEFAULTS = {
-    "network": {
-        "ssid": "",
-        "password": "",
-        "device_name": "scoreboard",
-        "connect_timeout_seconds": 60
-    },
-    "api": {
-        "url": "",
-        "key": ""
-    },
-    "display": {
-        "brightness": 100,
-        "poll_interval_seconds": 30,
-        "game_rotation_seconds": 60,
-        "data_frequency_khz": 20000,
-        "target_refresh_rate": 120,
-        "gamma": {"type": "srgb"},
-        "blanking_time_ns": 0,
-        # Screen layout variants (see scoreboard/screen_geometry.py tables).
-        # Applied live on config save — flip these from the settings page to
-        # compare layouts on the panel without a reboot. Single-design
-        # screens (pregame since 2026-07-15) carry no key; stale keys in a
-        # stored config are ignored by screen_geometry.set_variants.
-        "variants": {
-            "mlb_final": "C", "nba_final": "C", "football_final": "C",
-            "soccer_live": "A",
+# Integer defaults, named so the cadence repair in Config._load can reuse
+# them. const() folds them into the bytecode as immediates.
+_CONNECT_TIMEOUT_S = const(60)
+_POLL_INTERVAL_S = const(30)
+_GAME_ROTATION_S = const(60)
+_CACHE_MAX_AGE_S = const(600)
+
+
+def _fresh_defaults() -> dict:
+    """Build a new, independently mutable copy of the default config.
+
+    A literal rather than a deep copy of a module-level template: the
+    nested dicts are built straight from bytecode constants, so boot does
+    no recursive copy and no template tree sits on the heap between loads.
+    """
+    return {
+        "network": {
+            "ssid": "",
+            "password": "",
+            "device_name": "scoreboard",
+            "connect_timeout_seconds": _CONNECT_TIMEOUT_S
+        },
+        "api": {
+            "url": "",
+            "key": ""
+        },
+        "display": {
+            "brightness": 100,
+            "poll_interval_seconds": _POLL_INTERVAL_S,
+            "game_rotation_seconds": _GAME_ROTATION_S,
+            "data_frequency_khz": 20000,
+            "target_refresh_rate": 120,
+            "gamma": {"type": "srgb"},
+            "blanking_time_ns": 0,
+            # Screen layout variants (see scoreboard/screen_geometry.py tables).
+            # Applied live on config save — flip these from the settings page to
+            # compare layouts on the panel without a reboot. Single-design
+            # screens (pregame since 2026-07-15) carry no key; stale keys in a
+            # stored config are ignored by screen_geometry.set_variants.
+            "variants": {
+                "mlb_final": "C", "nba_final": "C", "football_final": "C",
+                "soccer_live": "A",
+            },
+            # Divider lines between screen sections; applied live.
+            "show_dividers": True,
+            # Game-description scroll speed (MLB play-by-play + soccer event/
+            # scorer text), px/s. Restricted to the smooth set in
+            # screen_geometry._SCROLL_SPEEDS; applied live.
+            "scroll_speed_px_per_sec": 20
+        },
+        "colors": {
+            "primary": {"r": 255, "g": 255, "b": 255},      # White - dividers, status text
+            "secondary": {"r": 128, "g": 128, "b": 128},    # Gray - venue, subtle elements
+            "accent": {"r": 255, "g": 255, "b": 0},         # Yellow - highlights, time
+            "clock_normal": {"r": 0, "g": 255, "b": 0},     # Green - clock with time remaining
+            "clock_warning": {"r": 255, "g": 10, "b": 10}   # Red - low time, errors
+        },
+        # Which leagues the poller rotates through, edited from the settings
+        # page's Sports card. `football.leagues` / `soccer.leagues` hold ESPN
+        # slugs (see the LEAGUE_NAMES tables in scoreboard/football.py: nfl,
+        # college-football; and scoreboard/soccer.py: usa.1, eng.1, mex.1,
+        # fifa.world); empty = that sport off. NBA defaults off like the league
+        # lists — flip it on when the season is on.
+        "sports": {
+            "mlb": {"enabled": True},
+            "nba": {"enabled": False},
+            "football": {"leagues": []},
+            "soccer": {"leagues": []}
+        },
+        "log": {
+            "level": "debug"
         },
-        # Divider lines between screen sections; applied live.
-        "show_dividers": True,
-        # Game-description scroll speed (MLB play-by-play + soccer event/
-        # scorer text), px/s. Restricted to the smooth set in
-        # screen_geometry._SCROLL_SPEEDS; applied live.
-        "scroll_speed_px_per_sec": 20
-    },
-    "colors": {
-        "primary": {"r": 255, "g": 255, "b": 255},      # White - dividers, status text
-        "secondary": {"r": 128, "g": 128, "b": 128},    # Gray - venue, subtle elements
-        "accent": {"r": 255, "g": 255, "b": 0},         # Yellow - highlights, time
-        "clock_normal": {"r": 0, "g": 255, "b": 0},     # Green - clock with time remaining
-        "clock_warning": {"r": 255, "g": 10, "b": 10}   # Red - low time, errors
-    },
-    # Which leagues the poller rotates through, edited from the settings
-    # page's Sports card. `football.leagues` / `soccer.leagues` hold ESPN
-    # slugs (see the LEAGUE_NAMES tables in scoreboard/football.py: nfl,
-    # college-football; and scoreboard/soccer.py: usa.1, eng.1, mex.1,
-    # fifa.world); empty = that sport off. NBA defaults off like the league
-    # lists — flip it on when the season is on.
-    "sports": {
-        "mlb": {"enabled": True},
-        "nba": {"enabled": False},
-        "football": {"leagues": []},
-        "soccer": {"leagues": []}
-    },
-    "log": {
-        "level": "debug"
-    },
-    "server": {
-        "cache_max_age_seconds": 600
-    },
-    # Hardware watchdog. Default OFF: once armed, machine.WDT cannot be
-    # disarmed, and it will reboot the device ~timeout_ms after mpremote
-    # interrupts the script — enable per-device once it's deployed/stable.
-    "watchdog": {
-        "enabled": False,
-        "timeout_ms": 8000
-    },
-    # Over-the-air app updates (see firmware/src/ota.py). Default ON: the
-    # whole point is that friends' devices update themselves.
-    "ota": {
-        "enabled": True
+        "server": {
+            "cache_max_age_seconds": _CACHE_MAX_AGE_S
+        },
+        # Hardware watchdog. Default OFF: once armed, machine.WDT cannot be
+        # disarmed, and it will reboot the device ~timeout_ms after mpremote
+        # interrupts the script — enable per-device once it's deployed/stable.
+        "watchdog": {
+            "enabled": False,
+            "timeout_ms": 8000
+        },
+        # Over-the-air app updates (see firmware/src/ota.py). Default ON: the
+        # whole point is that friends' devices update themselves.
+        "ota": {
+            "enabled": True
+        }
     }
-}
 
 
-def _deep_merge(base: dict, override: dict) -> dict:
+def _merge_into(base: dict, override: dict) -> None:
     """
-    Deep merge two dictionaries.
+    Merge override into base, in place.
 
-    Values from override take precedence. Nested dicts are merged recursively.
+    Values from override take precedence; where both sides hold a dict the
+    merge descends into it. base must be a private tree (a fresh
+    _fresh_defaults() result) — nothing is copied, so the only allocations
+    are the stored values themselves.
     """
-    result = base.copy()
-
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge_into(current, value)
         else:
-            result[key] = value
-
-    return result
+            base[key] = value
 
 
 class CadenceError(ValueError):
@@ -130,17 +146,6 @@ def _validate_cadence(poll_interval: int, rotation: int) -> None:
         )
 
 
-def _deep_copy(d: dict) -> dict:
-    """Create a deep copy of a nested dictionary."""
-    result = {}
-    for key, value in d.items():
-        if isinstance(value, dict):
-            result[key] = _deep_copy(value)
-        else:
-            result[key] = value
-    return result
-
-
 class Config:
     """
     Configuration manager for the Pico Scoreboard.
@@ -175,12 +180,16 @@ class Config:
         Invalid values fall back to defaults with a logged complaint.
         """
         try:
+            # One read + json.loads: MicroPython's json.load pulls the stream
+            # a byte at a time through the filesystem layer, while loads
+            # parses the in-RAM string in a single C pass.
             with open(self._path, 'r') as f:
-                data = json.load(f)
+                data = json.loads(f.read())
 
-            merged = _deep_merge(_deep_copy(_DEFAULTS), data)
+            merged = _fresh_defaults()
+            _merge_into(merged, data)
         except (OSError, ValueError):
-            merged = _deep_copy(_DEFAULTS)
+            merged = _fresh_defaults()
 
         try:
             _validate_cadence(
@@ -191,8 +200,8 @@ class Config:
             # logger.error is safe here: the module default level is DEBUG
             # until this Config finishes loading and pushes the real level.
             logger.error(f"[CONFIG] invalid cadence in {self._path}, using defaults: {e}")
-            merged["display"]["poll_interval_seconds"] = _DEFAULTS["display"]["poll_interval_seconds"]
-            merged["display"]["game_rotation_seconds"] = _DEFAULTS["display"]["game_rotation_seconds"]
+            merged["display"]["poll_interval_seconds"] = _POLL_INTERVAL_S
+            merged["display"]["game_rotation_seconds"] = _GAME_ROTATION_S
         return merged
 
     def _compute_log_level(self) -> int:
@@ -206,14 +215,29 @@ class Config:
         logger.debug(f"[CONFIG] reloaded: {self._path}")
 
     def save(self) -> None:
-        """Write current configuration to file."""
-        with open(self._path, 'w') as f:
-            json.dump(self._data, f)
+        """Write current configuration to file.
+
+        Serialized up front and written in one call (json.dump streams many
+        small writes to the filesystem), into a temp file that is renamed
+        over the real one — littlefs renames are atomic, so a power cut
+        mid-save leaves the previous config intact instead of a truncated
+        file that _load would discard for defaults (WiFi credentials
+        included).
+        """
+        text = json.dumps(self._data)
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.rename(tmp_path, self._path)
 
     def update(self, section: str, key: str, value: object) -> None:
         """
         Update a configuration value and save to file.
 
+        Writing the value already stored is a no-op: flash writes are the
+        slowest thing the device does (and wear the part), and the settings
+        page routinely re-sends unchanged fields.
+
         Args:
             section: Top-level section (e.g., "network", "api", "display")
             key: Key within section (e.g., "ssid", "url", "brightness")
@@ -224,6 +248,10 @@ class Config:
         """
         if section not in self._data:
             return
+        current = self._data[section]
+        # type check too: True == 1 and 60 == 60.0, but the JSON differs
+        if key in current and type(current[key]) is type(value) and current[key] == value:
+            return  # no-op write: skip the flash rewrite entirely
 
         if section == "display" and key in ("poll_interval_seconds", "game_rotation_seconds"):
             display = self._data["display"]
@@ -231,7 +259,7 @@ class Config:
             rotation = value if key == "game_rotation_seconds" else display["game_rotation_seconds"]
             _validate_cadence(int(poll), int(rotation))  # type: ignore[arg-type]
 
-        self._data[section][key] = value
+        current[key] = value
         if section == "log":
             self._log_level = self._compute_log_level()
             logger.set_level(self._log_level)
@@ -244,8 +272,9 @@ class Config:
         write, validating cross-key invariants against the merged result.
 
         Unknown sections and non-dict section values are ignored (same policy
-        as update()). Raises CadenceError before anything is applied if the
-        merged poll/rotation pair would be invalid.
+        as update()), and so are values equal to what's stored — a batch
+        that changes nothing never touches flash. Raises CadenceError before
+        anything is applied if the merged poll/rotation pair would be invalid.
         """
         # Validate the cadence pair as it will exist AFTER the merge, so a
         # jointly-valid pair can't be rejected for arriving in the "wrong"
@@ -263,8 +292,11 @@ class Config:
         for section, values in data.items():
             if section not in self._data or not isinstance(values, dict):
                 continue
+            stored = self._data[section]
             for key, value in values.items():
-                self._data[section][key] = value
+                if key in stored and type(stored[key]) is type(value) and stored[key] == value:
+                    continue
+                stored[key] = value
                 changed = True
 
         if not changed:
@@ -475,14 +507,17 @@ class Config:
         return self._log_level
 
     # Color properties
-    def get_color(self, name: str) -> dict:
+    def get_color(self, name: str) -> tuple:
         """
-        Get RGB color dict by name.
+        Get an RGB color by name.
 
         Args:
             name: Color name (primary, secondary, accent, clock_normal, clock_warning)
 
         Returns:
-            Dict with r, g, b keys (0-255 values)
+            (r, g, b) tuple of 0-255 ints, ready to splat into rgb565()
         """
-        return self._data["colors"].get(name, _DEFAULTS["colors"].get(name))
+        color = self._data["colors"].get(name)
+        if color is None:
+            color = _fresh_defaults()["colors"][name]
+        return color["r"], color["g"], color["b"]
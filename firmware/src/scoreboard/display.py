@@ -60,6 +60,7 @@ DIM_GRAY = rgb565(96, 96, 96)
 # render_mlb_live imports the helper (above) for its per-frame use.
 
 
+@micropython.native
 def pulse(now_ms: int, period_ms: int = 1000) -> int:
     """Triangle-wave factor in [0, 256], cycling every `period_ms`.
 
@@ -636,7 +637,7 @@ def draw_progress_bar(display: Hub75Display, x: int, y: int, width: int, height:
 class _startup_dots_loc:
     """WiFi attempt dots, centered in the gap between the progress bar
     (ends y=31) and the operation line (y=42). Sized for exactly 3 dots —
-    coupled to max_retries=3 in main.start_station_mode."""
+    coupled to _WIFI_MAX_RETRIES=3 in main.start_station_mode."""
     WIDTH = 3 * (dot_sprite.WIDTH + 1) - 1
     X = (DISPLAY_WIDTH - WIDTH) // 2
     Y = 34
@@ -1221,6 +1222,7 @@ _CLOCK_FONT = unscii_16
 _CLOCK_CHAR_W = unscii_16.GLYPHS[ord("0") - 32][1]
 
 
+@micropython.native
 def _draw_soccer_clock(display: Hub75Display, writer: FontWriter, rect: tuple,
                        sv, colors: UiColors, now_ms: int) -> None:
     """Draw the extrapolated match clock, allocation-free.
@@ -1944,6 +1946,13 @@ def run_display_thread(display: Hub75Display, writer: FontWriter, regions: Regio
     """
     from scoreboard.state import acquire_display_state
 
+    # Bound once: each tick calls these several times, and a local is one
+    # fast load where time.ticks_ms is a global load plus an attribute lookup.
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    ticks_add = time.ticks_add
+    sleep_ms = time.sleep_ms
+
     logger.debug("[DISPLAY] thread starting: core=1 rate=20fps")
 
     # ALL cross-frame state lives on this one object — see the Core 1
@@ -1956,16 +1965,16 @@ def run_display_thread(display: Hub75Display, writer: FontWriter, regions: Regio
     # (health's `slow` only counts >70 ms), so visible stutters and GC
     # events can be correlated directly. Frame-health telemetry is how the
     # 9 FPS scroll regression was found — cheap enough to keep.
-    ls = LoopState(time.ticks_ms(), gc.mem_alloc() if MEM_PROFILE else 0)
+    ls = LoopState(ticks_ms(), gc.mem_alloc() if MEM_PROFILE else 0)
 
     while True:
         # Heartbeat for the watchdog feeder: per tick, not per render.
         health.frame_seq = (health.frame_seq + 1) & 0x3FFFFFF
 
-        ls.deadline = time.ticks_add(ls.deadline, FRAME_MS)
+        ls.deadline = ticks_add(ls.deadline, FRAME_MS)
 
         try:
-            now_ms = time.ticks_ms()
+            now_ms = ticks_ms()
 
             if MEM_PROFILE:
                 _mp_now = gc.mem_alloc()
@@ -1985,7 +1994,7 @@ def run_display_thread(display: Hub75Display, writer: FontWriter, regions: Regio
                     if -_mp_d > ls.mp_maxdrop:
                         ls.mp_maxdrop = -_mp_d
 
-            _hb_period = time.ticks_diff(now_ms, ls.hb_prev_ms)
+            _hb_period = ticks_diff(now_ms, ls.hb_prev_ms)
             ls.hb_prev_ms = now_ms
             ls.hb_frames += 1
             if _hb_period > ls.hb_worst:
@@ -2018,7 +2027,7 @@ def run_display_thread(display: Hub75Display, writer: FontWriter, regions: Regio
                 ls.last_rendered_seq = seq
                 ls.last_frame_had_toast = toast_active
 
-            if time.ticks_diff(now_ms, ls.hb_last_report) >= 60_000:
+            if ticks_diff(now_ms, ls.hb_last_report) >= 60_000:
                 if logger.level >= DEBUG:
                     logger.debug(
                         "[DISPLAY] health: frames=%d slow=%d worst=%dms"
@@ -2027,7 +2036,7 @@ def run_display_thread(display: Hub75Display, writer: FontWriter, regions: Regio
                 ls.hb_frames = ls.hb_slow = ls.hb_worst = 0
                 ls.hb_last_report = now_ms
 
-            if MEM_PROFILE and time.ticks_diff(now_ms, ls.mp_report_ms) >= 10_000:
+            if MEM_PROFILE and ticks_diff(now_ms, ls.mp_report_ms) >= 10_000:
                 _mp_play = state.play
                 if logger.level >= DEBUG:
                     logger.debug(
@@ -2046,11 +2055,11 @@ def run_display_thread(display: Hub75Display, writer: FontWriter, regions: Regio
                 logger.error(f"[DISPLAY] thread error: {e}")
 
         # Deadline pacing: sleep whatever remains of this frame's budget.
-        remaining = time.ticks_diff(ls.deadline, time.ticks_ms())
+        remaining = ticks_diff(ls.deadline, ticks_ms())
         if remaining > 0:
-            time.sleep_ms(remaining)
+            sleep_ms(remaining)
         else:
             # Overran the budget (e.g. a GC pause): re-anchor instead of
             # bursting frames to catch up.
             ls.mp_over += 1
-            ls.deadline = time.ticks_ms()
+            ls.deadline = ticks_ms()
@@ -21,8 +21,8 @@ async def run_dns_server(ip_address: str = '192.168.4.1') -> None:
     Args:
         ip_address: The IP to return for all DNS queries (default: 192.168.4.1)
     """
-    # Convert IP string to bytes
-    ip_bytes: bytes = bytes(map(int, ip_address.split('.')))
+    # The answer record is identical for every query: build it once.
+    answer: bytes = _build_answer(bytes(map(int, ip_address.split('.'))))
 
     # Create UDP socket
     sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -41,7 +41,7 @@ async def run_dns_server(ip_address: str = '192.168.4.1') -> None:
             continue
 
         try:
-            response = _build_dns_response(data, ip_bytes)
+            response = _build_dns_response(data, answer)
             sock.sendto(response, addr)
         except Exception as e:
             # Malformed query (or send failure): drop it, keep serving.
@@ -52,13 +52,31 @@ async def run_dns_server(ip_address: str = '192.168.4.1') -> None:
         await asyncio.sleep_ms(0)
 
 
-def _build_dns_response(query: bytes, ip_bytes: bytes) -> bytes:
+# Response header after the transaction ID.
+# Flags: standard response, no error (0x8180); then
+# Questions: 1, Answers: 1, Authority: 0, Additional: 0
+_HEADER_TAIL = b'\x81\x80\x00\x01\x00\x01\x00\x00\x00\x00'
+
+
+def _build_answer(ip_bytes: bytes) -> bytes:
+    """
+    Build the A-record answer section returning `ip_bytes` (4 bytes, IPv4).
+    """
+    # Name pointer to question (0xC00C = pointer to offset 12)
+    # Type A (1), Class IN (1)
+    # TTL (60 seconds)
+    # Data length (4 bytes for IPv4)
+    # IP address
+    return b'\xc0\x0c' b'\x00\x01\x00\x01' b'\x00\x00\x00\x3c' b'\x00\x04' + ip_bytes
+
+
+def _build_dns_response(query: bytes, answer: bytes) -> bytes:
     """
     Build a DNS response that returns the given IP for any A record query.
 
     Args:
         query: The raw DNS query packet
-        ip_bytes: The IP address as bytes (4 bytes for IPv4)
+        answer: The prebuilt answer section (see _build_answer)
 
     Returns:
         The raw DNS response packet
@@ -66,15 +84,6 @@ def _build_dns_response(query: bytes, ip_bytes: bytes) -> bytes:
     if len(query) < 12:
         raise ValueError(f"query too short: {len(query)} bytes")
 
-    # Transaction ID (first 2 bytes of query)
-    transaction_id: bytes = query[:2]
-
-    # Flags: standard response, no error
-    flags: bytes = b'\x81\x80'
-
-    # Questions: 1, Answers: 1, Authority: 0, Additional: 0
-    counts: bytes = b'\x00\x01\x00\x01\x00\x00\x00\x00'
-
     # Find the question section (starts at byte 12). Walk the length-prefixed
     # name labels with bounds checks — a truncated packet must raise a clean
     # ValueError, not IndexError from a wild read.
@@ -85,18 +94,5 @@ def _build_dns_response(query: bytes, ip_bytes: bytes) -> bytes:
     if question_end > len(query):
         raise ValueError("truncated question section")
 
-    question: bytes = query[12:question_end]
-
-    # Answer section
-    # Name pointer to question (0xC00C = pointer to offset 12)
-    answer: bytes = b'\xc0\x0c'
-    # Type A (1), Class IN (1)
-    answer += b'\x00\x01\x00\x01'
-    # TTL (60 seconds)
-    answer += b'\x00\x00\x00\x3c'
-    # Data length (4 bytes for IPv4)
-    answer += b'\x00\x04'
-    # IP address
-    answer += ip_bytes
-
-    return transaction_id + flags + counts + question + answer
+    # Transaction ID (first 2 bytes of query), header, question, answer
+    return query[:2] + _HEADER_TAIL + query[12:question_end] + answer
@@ -62,12 +62,15 @@ PHASE_HALFTIME = 1
 PHASE_END_OF_PERIOD = 2
 
 
+# Period labels by wire period number (u8, so never negative). The common
+# case is a tuple index; only 2OT and beyond build a string, once per commit.
+_PERIOD_NAMES = ("Q0", "Q1", "Q2", "Q3", "Q4", "OT")
+
+
 def period_name(period: int) -> str:
     """Display name of a period: Q1-Q4, then OT / 2OT / ..."""
-    if period <= 4:
-        return "Q" + str(period)
-    if period == 5:
-        return "OT"
+    if period < len(_PERIOD_NAMES):
+        return _PERIOD_NAMES[period]
     return str(period - 4) + "OT"
 
 
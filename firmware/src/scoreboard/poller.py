@@ -121,7 +121,7 @@ class LeagueSource:
 
 
 def _flash_play(play, new_id: str, raw_text: str) -> bool:
-    """Stage the shared play-flash slot when `new_id` is new; True = commit.
+    """Stage the shared play-flash slot when `new_id` is new; True = staged.
 
     One machinery for every sport's flash line (MLB play, NBA play, soccer
     commentary): the write buffer's previous play.id is carried forward
@@ -144,12 +144,11 @@ def _flash_play(play, new_id: str, raw_text: str) -> bool:
 
 
 def _commit_mlb_live(poller, game_id: str, live, home_logo, away_logo) -> None:
-    set_mlb_live(live, home_logo, away_logo)
-
     # MLB always carries a current play; the shared flash slot handles
-    # change detection.
-    if _flash_play(get_write_state().play, live.last_play.id, live.last_play.text):
-        commit_state()
+    # change detection. Staged before the setter so its commit publishes
+    # screen and flash together (one swap per poll, not two).
+    _flash_play(get_write_state().play, live.last_play.id, live.last_play.text)
+    set_mlb_live(live, home_logo, away_logo)
 
 
 def _commit_soccer_live(poller, game_id: str, live, home_logo, away_logo) -> None:
@@ -158,34 +157,34 @@ def _commit_soccer_live(poller, game_id: str, live, home_logo, away_logo) -> Non
     # advancing while claiming in-play (weather delay, stale feed).
     prev = poller._prev_soccer_clock
     prev_clock_s = prev[1] if prev is not None and prev[0] == game_id else None
+
+    # Commentary rides the shared flash slot, staged ahead of the setter's
+    # single commit.
+    _flash_play(get_write_state().play, live.comment_id, live.comment_text)
     set_soccer_live(live, home_logo, away_logo, prev_clock_s)
     poller._prev_soccer_clock = (game_id, live.clock_seconds)
 
-    # Commentary rides the shared flash slot.
-    if _flash_play(get_write_state().play, live.comment_id, live.comment_text):
-        commit_state()
-
 
 def _commit_nba_live(poller, game_id: str, live, home_logo, away_logo) -> None:
-    set_nba_live(live, home_logo, away_logo)
-
     # NBA's last play is optional (absent before the opening tip) — no play,
     # no flash, and the shared play slot keeps its previous id so a play
-    # that reappears unchanged doesn't re-flash.
+    # that reappears unchanged doesn't re-flash. Staged ahead of the
+    # setter's single commit.
     play = live.last_play
-    if play is not None and _flash_play(get_write_state().play, play.id, play.text):
-        commit_state()
+    if play is not None:
+        _flash_play(get_write_state().play, play.id, play.text)
+    set_nba_live(live, home_logo, away_logo)
 
 
 def _commit_football_live(poller, game_id: str, live, home_logo, away_logo) -> None:
-    set_football_live(live, home_logo, away_logo)
-
     # Football's last play is optional (absent between drives / pre-snap
     # early game) — no play, no flash, and the shared play slot keeps its
     # previous id so a play that reappears unchanged doesn't re-flash.
+    # Staged ahead of the setter's single commit.
     play = live.last_play
-    if play is not None and _flash_play(get_write_state().play, play.id, play.text):
-        commit_state()
+    if play is not None:
+        _flash_play(get_write_state().play, play.id, play.text)
+    set_football_live(live, home_logo, away_logo)
 
 
 def mlb_source() -> LeagueSource:
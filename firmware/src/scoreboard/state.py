@@ -23,10 +23,12 @@ readers — Core 1 does no per-frame string formatting.
 import time
 import _thread
 import framebuf
+from micropython import const
 
 from hub75 import Hub75Driver, gamma as gamma_mod
 from scoreboard.config import Config
 import scoreboard.logger as logger
+from scoreboard.logger import DEBUG
 from scoreboard.fonts import rgb565, measure_text, fit_text, render_strip, spleen_5x8, unscii_8, unscii_16
 from scoreboard import screen_geometry
 from scoreboard.inning_half import BOTTOM, TOP
@@ -46,7 +48,7 @@ from scoreboard.soccer import (
 # Lives here (not display.py) so Core 0 state setters can pre-brighten team
 # colors at commit time without importing display; the live renderers import
 # _team_color_to_rgb565 from this module for their per-frame use.
-_TEAM_COLOR_MIN_CHANNEL = 128
+_TEAM_COLOR_MIN_CHANNEL = const(128)
 
 
 def _team_color_to_rgb565(packed: int) -> int:
@@ -82,7 +84,12 @@ class ThreadHealth:
 
 
 # Length cap for one line of spleen_5x8 text across the full display.
-_LINE_MAX_CHARS = 25
+_LINE_MAX_CHARS = const(25)
+
+# Error screen caps: the title is drawn in unscii_16, and the body has one
+# region per line (regions.error_line_0..3 in display.render_error).
+_ERR_TITLE_MAX = const(12)
+_ERR_LINES_MAX = const(4)
 
 
 def _truncate_line(text: str) -> str:
@@ -98,6 +105,7 @@ def _truncate_line(text: str) -> str:
 # Each class is plain data plus a copy_from() used by the carry-forward copy
 # after a commit. Adding a field means adding it to __init__ AND copy_from of
 # the same class — the two live side by side so they can't drift apart.
+# (UiColors is the exception: immutable once published, shared by reference.)
 
 
 class StartupState:
@@ -642,7 +650,13 @@ class FootballLiveView:
 
 
 class UiColors:
-    """Pre-computed UI colors (RGB565), set by Core 0."""
+    """Pre-computed UI colors (RGB565), set by Core 0.
+
+    Immutable once published: update_ui_colors builds a fresh instance and
+    swaps the reference, so the carry-forward shares it across buffers by
+    reference (no copy_from — colors only change on a config save, yet every
+    commit used to copy all five).
+    """
 
     def __init__(self) -> None:
         self.primary: int = 0xFFFF
@@ -651,13 +665,6 @@ class UiColors:
         self.clock_normal: int = 0xFFFF
         self.clock_warning: int = 0xFFFF
 
-    def copy_from(self, other: "UiColors") -> None:
-        self.primary = other.primary
-        self.secondary = other.secondary
-        self.accent = other.accent
-        self.clock_normal = other.clock_normal
-        self.clock_warning = other.clock_warning
-
 
 class StateBuffer:
     """Complete display state snapshot. Pre-allocated, mutated in place."""
@@ -695,7 +702,7 @@ class StateBuffer:
         self.setup.copy_from(other.setup)
         self.error.copy_from(other.error)
         self.updating.copy_from(other.updating)
-        self.ui_colors.copy_from(other.ui_colors)
+        self.ui_colors = other.ui_colors   # immutable: shared by reference
         self.mlb_live.copy_from(other.mlb_live)
         self.play.copy_from(other.play)
         self.pregame.copy_from(other.pregame)
@@ -716,7 +723,7 @@ class StateBuffer:
 
 # commit_seq wraps below MicroPython's small-int limit so incrementing never
 # promotes to a heap-allocated big int. Consumers compare with != only.
-_SEQ_MASK = 0x3FFFFFF
+_SEQ_MASK = const(0x3FFFFFF)
 
 
 class TripleBufferedState:
@@ -736,7 +743,7 @@ class TripleBufferedState:
     """
 
     def __init__(self) -> None:
-        self._buffers: list[StateBuffer] = [StateBuffer(), StateBuffer(), StateBuffer()]
+        self._buffers: tuple = (StateBuffer(), StateBuffer(), StateBuffer())
         self._latest: int = 0    # Most recently committed buffer
         self._reading: int = 0   # Buffer latched by the display thread
         self._writing: int = 1   # Writer's private buffer
@@ -760,15 +767,17 @@ class TripleBufferedState:
     def commit(self) -> None:
         """Core 0: publish the write buffer and prepare the next one."""
         with self._lock:
-            self._latest = self._writing
+            latest = self._writing
+            reading = self._reading
+            self._latest = latest
             # The new write buffer is whichever one is neither published nor
-            # latched by the reader (they may be the same buffer).
-            if self._latest != 0 and self._reading != 0:
-                self._writing = 0
-            elif self._latest != 1 and self._reading != 1:
-                self._writing = 1
-            else:
-                self._writing = 2
+            # latched by the reader. For two distinct indices in {0, 1, 2}
+            # the third is a ^ b ^ 3; when they coincide that yields 3 and
+            # any other buffer will do.
+            writing = latest ^ reading ^ 3
+            if writing == 3:
+                writing = 1 if reading == 0 else 0
+            self._writing = writing
             self._commit_seq = (self._commit_seq + 1) & _SEQ_MASK
         # Carry forward outside the lock: the new write buffer is private to
         # this thread, and reading `latest` concurrently with Core 1 is safe.
@@ -875,13 +884,14 @@ def finish_startup(target_mode: str, **mode_kwargs) -> None:
 # WiFi QR code generation (for setup screen)
 # =============================================================================
 
-_qr_palette_buf: bytearray = bytearray(4)
+# Two RGB565 entries, pre-encoded: index 0 = 0xFFFF white (QR background /
+# light modules), index 1 = 0x0000 black (dark modules). Both are
+# byte-symmetric, so the literal is endian-independent.
+_qr_palette_buf: bytearray = bytearray(b'\xff\xff\x00\x00')
 _qr_palette: framebuf.FrameBuffer = framebuf.FrameBuffer(_qr_palette_buf, 2, 1, framebuf.RGB565)
-_qr_palette.pixel(0, 0, 0xFFFF)  # Index 0: white (QR background/light modules)
-_qr_palette.pixel(1, 0, 0x0000)  # Index 1: black (QR dark modules)
 
 
-_QR_QUIET_ZONE = 4  # Minimum quiet zone per QR spec (4 modules)
+_QR_QUIET_ZONE = const(4)  # Minimum quiet zone per QR spec (4 modules)
 
 
 def _generate_wifi_qr(ssid: str, password: str = '') -> tuple[framebuf.FrameBuffer, int, int, framebuf.FrameBuffer]:
@@ -974,11 +984,20 @@ def set_error(title: str, lines: list[str] | None = None) -> None:
 
     Thread-safe: writes to the back buffer and commits. Truncates the title
     and lines here so the display thread draws them verbatim.
+
+    The lines list is built fresh rather than overwritten in place: the
+    carry-forward copy shares it by reference across all three buffers, so
+    mutating it would change a list Core 1 may be mid-frame on. Indexing
+    the caller's list directly skips the intermediate slice copy.
     """
     state = get_write_state()
     state.mode = 'error'
-    state.error.title = title[:12] if title else 'ERROR'
-    state.error.lines = [_truncate_line(line) for line in (lines or [])[:4]]
+    state.error.title = title[:_ERR_TITLE_MAX] if title else 'ERROR'
+    if lines:
+        n = len(lines) if len(lines) < _ERR_LINES_MAX else _ERR_LINES_MAX
+        state.error.lines = [_truncate_line(lines[i]) for i in range(n)]
+    else:
+        state.error.lines = []
     commit_state()
 
 
@@ -1283,7 +1302,8 @@ def set_pregame(game, home_logo, away_logo, utc_offset_s: int | None,
     pv.venue_text = game.venue or ''
 
     if utc_offset_s is not None:
-        tm = time.gmtime(game.start_epoch + utc_offset_s)
+        local_s = game.start_epoch + utc_offset_s
+        tm = time.gmtime(local_s)
         hour = tm[3]
         minute = tm[4]
         ampm = 'AM' if hour < 12 else 'PM'
@@ -1292,10 +1312,11 @@ def set_pregame(game, home_logo, away_logo, utc_offset_s: int | None,
             h12 = 12
         pv.time_text = "%d:%02d %s" % (h12, minute, ampm)
         # Date phase only when the game's LOCAL day isn't today's local day
-        # (RTC is UTC; same additive-offset trick as the time above). At 10
-        # glyphs max ("WED JUL 16") this always fits the 80px big slot.
-        today = time.gmtime(time.time() + utc_offset_s)
-        if (tm[0], tm[1], tm[2]) != (today[0], today[1], today[2]):
+        # (RTC is UTC; same additive-offset trick as the time above). Whole
+        # local days since the epoch compare with one integer division each
+        # — no second gmtime() tuple for "now". At 10 glyphs max
+        # ("WED JUL 16") this always fits the 80px big slot.
+        if local_s // 86400 != (time.time() + utc_offset_s) // 86400:
             pv.date_text = "%s %s %d" % (_WDAYS[tm[6]], _MONTHS[tm[1]], tm[2])
         else:
             pv.date_text = ''
@@ -1852,19 +1873,20 @@ def set_football_final(game, home_logo, away_logo) -> None:
 # =============================================================================
 
 def update_ui_colors(config: Config) -> None:
-    """Pre-compute UI colors on Core 0. Call at startup and when config changes."""
-    from scoreboard.fonts import rgb565
-
-    def to_rgb565(color_dict: dict) -> int:
-        return rgb565(color_dict["r"], color_dict["g"], color_dict["b"])
+    """Pre-compute UI colors on Core 0. Call at startup and when config changes.
 
-    state = get_write_state()
-    colors = state.ui_colors
-    colors.primary = to_rgb565(config.get_color('primary'))
-    colors.secondary = to_rgb565(config.get_color('secondary'))
-    colors.accent = to_rgb565(config.get_color('accent'))
-    colors.clock_normal = to_rgb565(config.get_color('clock_normal'))
-    colors.clock_warning = to_rgb565(config.get_color('clock_warning'))
+    Config.get_color hands back plain (r, g, b) ints, which go straight into
+    the viper rgb565 packer — no per-channel dict lookups, no closure.
+    """
+    colors = UiColors()
+    colors.primary = rgb565(*config.get_color('primary'))
+    colors.secondary = rgb565(*config.get_color('secondary'))
+    colors.accent = rgb565(*config.get_color('accent'))
+    colors.clock_normal = rgb565(*config.get_color('clock_normal'))
+    colors.clock_warning = rgb565(*config.get_color('clock_warning'))
+    # One reference store publishes the whole set (see UiColors): never
+    # mutate the instance the buffers already share.
+    get_write_state().ui_colors = colors
     commit_state()
     logger.debug("[CONFIG] ui colors updated from config")
 
@@ -1912,13 +1934,15 @@ def update_screen_variants(config: Config) -> None:
 def update_show_dividers(config: Config) -> None:
     """Apply config display.show_dividers (live; read per frame)."""
     on = screen_geometry.set_show_dividers(config.show_dividers)
-    logger.debug("[CONFIG] dividers: %s" % ("on" if on else "off"))
+    if logger.level >= DEBUG:
+        logger.debug("[CONFIG] dividers: %s" % ("on" if on else "off"))
 
 
 def update_scroll_speed(config: Config) -> None:
     """Apply config display.scroll_speed_px_per_sec (live; read per use)."""
     v = screen_geometry.set_scroll_speed(config.scroll_speed_px_per_sec)
-    logger.debug("[CONFIG] scroll speed: %d px/s" % v)
+    if logger.level >= DEBUG:
+        logger.debug("[CONFIG] scroll speed: %d px/s" % v)
 
 
 def update_display_frequency(config: Config) -> None:
@@ -1928,7 +1952,8 @@ def update_display_frequency(config: Config) -> None:
 
     data_freq = config.data_frequency_hz
     _display_driver.set_frequency(data_freq)
-    logger.debug(f"[CONFIG] display frequency updated: {data_freq // 1000}kHz")
+    if logger.level >= DEBUG:
+        logger.debug(f"[CONFIG] display frequency updated: {data_freq // 1000}kHz")
 
 
 def update_display_refresh_rate(config: Config) -> None:
@@ -1937,7 +1962,8 @@ def update_display_refresh_rate(config: Config) -> None:
         return
 
     rate = _display_driver.set_target_refresh_rate(config.target_refresh_rate)
-    logger.debug(f"[CONFIG] display refresh rate updated: {rate:.1f}Hz")
+    if logger.level >= DEBUG:
+        logger.debug(f"[CONFIG] display refresh rate updated: {rate:.1f}Hz")
 
 
 def update_display_gamma(config: Config) -> None:
@@ -1947,6 +1973,8 @@ def update_display_gamma(config: Config) -> None:
 
     gamma_value = config.gamma
     _display_driver.set_gamma(gamma_value)
+    if logger.level < DEBUG:
+        return
     if gamma_value is None:
         logger.debug("[CONFIG] display gamma updated: none (linear)")
     elif isinstance(gamma_value, gamma_mod.Power):
@@ -1962,4 +1990,5 @@ def update_display_blanking_time(config: Config) -> None:
 
     _display_driver.set_blanking_time(config.blanking_time_ns)
     rate = _display_driver.set_target_refresh_rate(config.target_refresh_rate)
-    logger.debug(f"[CONFIG] display blanking time updated: {config.blanking_time_ns}ns (refresh recomputed: {rate:.1f}Hz)")
+    if logger.level >= DEBUG:
+        logger.debug(f"[CONFIG] display blanking time updated: {config.blanking_time_ns}ns (refresh recomputed: {rate:.1f}Hz)")
@@ -144,6 +144,10 @@ export interface NetworkStatus {
 	// Memory telemetry
 	memory_used: number;
 	memory_free: number;
+	// Lower bound on the largest single allocation that fits (probed at most
+	// every 30 s, capped at 40 KB). Far below both the cap and memory_free
+	// means the heap is fragmented.
+	memory_largest_free?: number;
 	flash_used: number;
 	flash_free: number;
 	// sha256 of the running app's ROMFS image; null on dev (littlefs) deploys
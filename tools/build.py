@@ -19,10 +19,14 @@ Prerequisites:
 
 import hashlib
 import json
+import os
 import shutil
 import subprocess
 import argparse
+import glob
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from compile_layout import compile_all as compile_layout_all
@@ -33,6 +37,8 @@ root_directory = Path(__file__).parent.parent
 firmware_source = root_directory / 'firmware' / 'src'
 frontend_directory = root_directory / 'frontend'
 frontend_build = frontend_directory / 'build'
+# Incremental build/flash manifests (see _manifest_path); gitignored
+build_cache = root_directory / '.build-cache'
 
 # Files to always copy without compilation (glob patterns)
 COPY_ONLY_FILES = [
@@ -44,13 +50,31 @@ COPY_ONLY_FILES = [
 ]
 
 # Files/directories to skip entirely (glob patterns)
-# Note: Path.full_match matches against the whole path and `*` does not cross
-# separators, so these patterns need a `**/` prefix to match at any depth.
+# Note: patterns match against the whole source-relative path and `*` does
+# not cross separators, so they need a `**/` prefix to match at any depth.
 SKIP_FILES = [
     '**/__pycache__/**',  # Python cache directories
     '**/*.pyc',           # Compiled Python cache
 ]
 
+
+def _compile_globs(patterns: list) -> re.Pattern:
+    """One regex matching any of `patterns` against a '/'-separated path,
+    so the per-file check is a single match instead of a glob per pattern."""
+    return re.compile('|'.join(
+        glob.translate(p, recursive=True, include_hidden=True, seps='/')
+        for p in patterns))
+
+
+_COPY_ONLY_RE = _compile_globs(COPY_ONLY_FILES)
+_SKIP_RE = _compile_globs(SKIP_FILES)
+
+# mpy-cross's error for native/viper code built without -march reports
+# "invalid arch" as the exception message ("SyntaxError: invalid arch");
+# anchor on that so an unrelated error whose text mentions it can't match.
+_ARCH_RE = re.compile(r'(?:^|: )invalid arch\b', re.IGNORECASE | re.MULTILINE)
+
+
 def _load_build_config() -> dict:
     """Load default argument values from tools/build.config.json if present."""
     config_path = Path(__file__).parent / 'build.config.json'
@@ -63,8 +87,42 @@ def _load_build_config() -> dict:
 _build_config = _load_build_config()
 
 
-def build_frontend() -> bool:
-    """Build the SvelteKit frontend using Bun."""
+# Everything `bun run build` reads (plus any .env* files). The build output
+# records a hash of them, so an unchanged frontend skips bun entirely.
+_FRONTEND_INPUTS = ('src', 'static', 'package.json', 'bun.lock', '.npmrc',
+                    'svelte.config.js', 'vite.config.ts', 'tsconfig.json')
+_FRONTEND_STAMP = frontend_build / '.inputs.hash'
+
+
+def _frontend_inputs_hash() -> str:
+    """Content hash of the frontend inputs, walked in a stable order."""
+    paths = []
+    for name in _FRONTEND_INPUTS:
+        path = frontend_directory / name
+        if path.is_dir():
+            paths.extend(p for p in path.rglob('*') if p.is_file())
+        elif path.exists():
+            paths.append(path)
+    paths.extend(frontend_directory.glob('.env*'))
+
+    h = hashlib.blake2b()
+    for path in sorted(paths):
+        h.update(path.relative_to(frontend_directory).as_posix().encode())
+        h.update(b'\0')
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def build_frontend(force: bool = False) -> bool:
+    """Build the SvelteKit frontend using Bun, unless nothing it reads has
+    changed since the last successful build (`force` rebuilds regardless)."""
+    inputs_hash = _frontend_inputs_hash()
+    if (not force and (frontend_build / 'index.html.gz').exists()
+            and _FRONTEND_STAMP.exists()
+            and _FRONTEND_STAMP.read_text() == inputs_hash):
+        print("Frontend unchanged since last build; skipping bun build.")
+        return True
+
     print("Building frontend...")
     result = subprocess.run(
         ['bun', 'run', 'build'],
@@ -74,77 +132,270 @@ def build_frontend() -> bool:
     if result.returncode != 0:
         print("Frontend build failed!")
         return False
+    _FRONTEND_STAMP.write_text(inputs_hash)
     print("Frontend build complete.")
     return True
 
 
-def process_firmware_files(output_dir: Path, configuration: str, arch: str):
+def _copy_output(src: str, output_path: str):
+    """Copy src to output_path via a `.tmp` sibling and os.replace.
+
+    Every build output is written this way (mpy-cross too, see
+    _process_one), so an interrupted build never leaves a truncated file
+    under the real name for the incremental manifest to mistake for a
+    good one. A stray .tmp is swept as stale on the next build.
+    """
+    tmp_path = output_path + '.tmp'
+    try:
+        shutil.copy2(src, tmp_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, output_path)
+
+
+def _process_one(relative: str, src: str, out_root: str, configuration: str,
+                 arch: str) -> tuple[str, str, str]:
+    """Compile or copy one firmware source file.
+
+    `relative` is the '/'-separated source-relative path, `src` the source
+    file and `out_root` the output directory with a trailing separator.
+    Runs on a worker thread; returns (kind, message, written) with kind
+    'compiled' or 'copied' and `written` the '/'-separated output path, so
+    the caller can count and print in source order.
+    """
+    output_path = out_root + relative
+
+    # Copy non-.py files and copy-only patterns
+    if not relative.endswith('.py') or _COPY_ONLY_RE.match(relative):
+        _copy_output(src, output_path)
+        return 'copied', f"  Copied {relative}", relative
+
+    # In dev mode, copy .py files without compilation
+    if configuration == 'dev':
+        _copy_output(src, output_path)
+        return 'copied', f"  Copied {relative} (dev mode)", relative
+
+    # Try to compile .py to .mpy
+    mpy_relative = relative[:-3] + '.mpy'
+    mpy_path = out_root + mpy_relative
+    mpy_tmp = mpy_path + '.tmp'
+    try:
+        cmd = ['mpy-cross', '-o', mpy_tmp, src]
+        if arch != 'all':
+            cmd.append(f'-march={arch}')
+
+        try:
+            subprocess.run(cmd, capture_output=True, check=True, text=True)
+        except BaseException:
+            Path(mpy_tmp).unlink(missing_ok=True)
+            raise
+        os.replace(mpy_tmp, mpy_path)
+        return 'compiled', f"  Compiled {relative} -> {mpy_relative}", mpy_relative
+
+    except subprocess.CalledProcessError as e:
+        # If compilation fails due to arch requirements, fall back to copying
+        if e.stderr and _ARCH_RE.search(e.stderr):
+            _copy_output(src, output_path)
+            return 'copied', f"  Copied {relative} (multi-arch required)", relative
+        print(f"  Error compiling {relative}:")
+        print(f"    {e.stderr or e.stdout}")
+        raise
+
+
+def _walk(root: Path):
+    """Yield the os.DirEntry of every file under root, depth-first.
+
+    scandir's entries carry the file type from the directory read itself,
+    so telling files from directories costs no extra stat per entry.
+    Symlinked directories are not followed (as with rglob) and are skipped
+    with a warning rather than handed on as if they were files.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+                elif entry.is_dir():
+                    print(f"  Warning: skipping symlinked directory {entry.path}")
+
+
+def _manifest_path(output_dir: Path, kind: str) -> Path:
+    """Where the `kind` ('build', ...) manifest for output_dir lives.
+
+    Always under build_cache, never inside or beside the output tree: it
+    must not ship in an image or flash, and `-o` can point anywhere. The
+    name carries a hash of the resolved path so outputs sharing a name
+    don't share a manifest.
+    """
+    key = hashlib.blake2b(str(output_dir.resolve()).encode(), digest_size=6).hexdigest()
+    return build_cache / f'{output_dir.name}-{key}.{kind}-manifest.json'
+
+
+def _write_manifest(path: Path, manifest: dict):
+    """Write a manifest returned by _manifest_path, creating build_cache."""
+    build_cache.mkdir(exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=1))
+
+
+def _load_manifest(path: Path) -> dict:
+    """Read a manifest; a missing or corrupt one is just an empty cache."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+# Hashing is I/O-bound and file_digest releases the GIL while it reads and
+# hashes, so a hashing pool can run well past the core count.
+_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+def _file_sha256(path: str | Path) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def _hash_files(paths: list) -> list:
+    """sha256 hex digests of `paths`, in order, hashed concurrently."""
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as pool:
+        return list(pool.map(_file_sha256, paths))
+
+
+def _mpy_cross_version() -> str:
+    """mpy-cross's version banner, part of the build cache key so a toolchain
+    bump recompiles everything. Missing mpy-cross surfaces at compile time."""
+    try:
+        result = subprocess.run(['mpy-cross', '--version'], capture_output=True, text=True)
+    except OSError:
+        return 'unknown'
+    return result.stdout.strip()
+
+
+def process_firmware_files(output_dir: Path, configuration: str, arch: str,
+                           verbose: bool = False) -> set:
     """
     Process firmware files - compile .py to .mpy or copy.
 
     In release mode, .py files are compiled to .mpy using mpy-cross.
     In dev mode, all files are copied without compilation.
 
+    Every file is independent, so they are processed on a thread pool: each
+    compile is its own mpy-cross process, and the threads only wait on it.
+
+    Incremental: a build manifest beside the output tree records each
+    source's size, mtime and sha256, the output it produced, and the
+    configuration/arch/mpy-cross version it was built with. A source whose
+    stat (or, failing that, content hash) and cache key match, and whose
+    output still exists, is skipped.
+
+    Returns the '/'-separated output paths this build expects, so do_build
+    can sweep everything else out of output_dir.
+
     Args:
         output_dir: Destination directory for processed files
         configuration: 'dev' or 'release'
         arch: Target architecture ('armv6m', 'armv7emsp', or 'all')
+        verbose: Print a line per compiled/copied file, written in one go
+            after the pool finishes (the totals line always prints)
     """
     print(f"Processing firmware files ({configuration} mode)...")
 
-    compiled_count = 0
-    copied_count = 0
-
-    for file in firmware_source.rglob('*'):
-        if file.is_dir():
-            continue
-
-        relative_path = file.relative_to(firmware_source)
-        output_path = output_dir / relative_path
-
+    manifest_path = _manifest_path(output_dir, 'build')
+    previous = _load_manifest(manifest_path)
+    tool = _mpy_cross_version() if configuration == 'release' else '-'
+    cache_key = f'{configuration}/{arch}/{tool}'
+    reusable = previous.get('files', {}) if previous.get('key') == cache_key else {}
+
+    # Per-file path work is plain string slicing and concatenation on
+    # these prefixes; no Path objects are built inside the loops.
+    src_root = os.path.join(firmware_source, '')
+    out_root = os.path.join(output_dir, '')
+
+    files = {}
+    jobs = []
+    unchanged_count = 0
+    for dir_entry in _walk(firmware_source):
         # Skip files that should never be included
-        if any(file.full_match(p) for p in SKIP_FILES):
+        relative = dir_entry.path[len(src_root):]
+        if os.sep != '/':
+            relative = relative.replace(os.sep, '/')
+        if _SKIP_RE.match(relative):
             continue
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        stat = dir_entry.stat()
+        entry = reusable.get(relative)
+        if entry is not None and os.path.exists(out_root + entry['output']):
+            if entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                files[relative] = entry
+                unchanged_count += 1
+                continue
+            digest = _file_sha256(dir_entry.path)
+            if digest == entry['sha256']:
+                files[relative] = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                unchanged_count += 1
+                continue
+
+        jobs.append((relative, dir_entry.path, stat))
+
+    # Create the output tree up front so workers never race on mkdir
+    for parent in {os.path.dirname(out_root + relative) for relative, _, _ in jobs}:
+        os.makedirs(parent, exist_ok=True)
 
-        # Copy non-.py files and copy-only patterns
-        if file.suffix != '.py' or any(file.full_match(p) for p in COPY_ONLY_FILES):
-            shutil.copy2(file, output_path)
-            copied_count += 1
-            print(f"  Copied {relative_path}")
-            continue
-
-        # In dev mode, copy .py files without compilation
-        if configuration == 'dev':
-            shutil.copy2(file, output_path)
-            copied_count += 1
-            print(f"  Copied {relative_path} (dev mode)")
-            continue
-
-        # Try to compile .py to .mpy
-        try:
-            mpy_path = output_path.with_suffix('.mpy')
-            cmd = ['mpy-cross', '-o', str(mpy_path), str(file)]
-            if arch != 'all':
-                cmd.append(f'-march={arch}')
-
-            result = subprocess.run(cmd, capture_output=True, check=True, text=True)
-            compiled_count += 1
-            print(f"  Compiled {relative_path} -> {relative_path.with_suffix('.mpy')}")
-
-        except subprocess.CalledProcessError as e:
-            # If compilation fails due to arch requirements, fall back to copying
-            if 'invalid arch' in (e.stderr or ''):
-                shutil.copy2(file, output_path)
-                copied_count += 1
-                print(f"  Copied {relative_path} (multi-arch required)")
+    compiled_count = 0
+    copied_count = 0
+    log = []
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        # Each worker hashes its source too, so the manifest's digests come
+        # off the pool instead of a serial pass afterwards
+        # Hash before processing: if the file is saved mid-build, the
+        # recorded digest is then never newer than the output it vouches
+        # for, so the next build recompiles instead of reusing stale output.
+        results = pool.map(
+            lambda job: (_file_sha256(job[1]),
+                         *_process_one(job[0], job[1], out_root, configuration, arch)),
+            jobs)
+        for (relative, _, stat), (digest, kind, message, written) in zip(jobs, results):
+            if kind == 'compiled':
+                compiled_count += 1
             else:
-                print(f"  Error compiling {relative_path}:")
-                print(f"    {e.stderr or e.stdout}")
-                raise
-
-    print(f"  Compiled: {compiled_count}, Copied: {copied_count}")
+                copied_count += 1
+            if verbose:
+                log.append(message)
+            files[relative] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': digest,
+                'output': written,
+            }
+
+    if log:
+        print('\n'.join(log))
+    _write_manifest(manifest_path, {'key': cache_key, 'files': files})
+    print(f"  Compiled: {compiled_count}, Copied: {copied_count}, Unchanged: {unchanged_count}")
+    return {entry['output'] for entry in files.values()}
+
+
+def _remove_stale_outputs(output_dir: Path, expected: set) -> None:
+    """Delete files under output_dir that this build did not produce, then
+    any directories left empty. This replaces wiping the output tree: it
+    catches deleted sources, the .py/.mpy twin left by a dev <-> release
+    switch, and leftovers from builds that predate the build manifest."""
+    removed = 0
+    for dir_entry in list(_walk(output_dir)):
+        relative = os.path.relpath(dir_entry.path, output_dir).replace(os.sep, '/')
+        if relative not in expected:
+            os.unlink(dir_entry.path)
+            removed += 1
+    for directory, _, _ in sorted(os.walk(output_dir), key=lambda w: len(w[0]), reverse=True):
+        if directory != str(output_dir) and not os.listdir(directory):
+            os.rmdir(directory)
+    if removed:
+        print(f"  Removed {removed} stale output file(s)")
 
 
 def copy_frontend_build(output_dir: Path) -> bool:
@@ -156,7 +407,7 @@ def copy_frontend_build(output_dir: Path) -> bool:
         print(f"Warning: {src} not found. Run frontend build first.")
         return False
 
-    shutil.copy2(src, dst)
+    _copy_output(str(src), str(dst))
     print(f"  Copied index.html.gz from frontend build")
     return True
 
@@ -264,7 +515,25 @@ _LITTLEFS_FILES = ('main.py', 'ota.py', 'config.json')
 # App artifacts a release deploy removes from littlefs: littlefs precedes
 # /rom on sys.path (that's the dev-override mechanism), so stale littlefs
 # copies would silently shadow the ROMFS app.
-_LITTLEFS_PURGE = (':scoreboard', ':lib', ':hardware_diagnostic.mpy', ':index.html.gz')
+_LITTLEFS_PURGE = ('scoreboard', 'lib', 'hardware_diagnostic.mpy', 'index.html.gz')
+
+# Runs in the safe-mode session: recursively remove each purge target. A
+# target that is already gone (ENOENT) is fine; any other error propagates
+# so the exec fails and the flash stops.
+_LITTLEFS_PURGE_SNIPPET = """import os
+def rm(p):
+ try:
+  if os.stat(p)[0] & 0x4000:
+   for n in os.listdir(p):
+    rm(p + '/' + n)
+   os.rmdir(p)
+  else:
+   os.remove(p)
+ except OSError as e:
+  if e.args[0] != 2:
+   raise
+for p in {targets!r}:
+ rm(p)"""
 
 def _romfs_partition_bytes() -> int:
     """Read MICROPY_HW_ROMFS_BYTES from the board header — single source of
@@ -315,7 +584,7 @@ def build_romfs_image(source_dir: Path) -> tuple[Path, str]:
 
     partition_bytes = _romfs_partition_bytes()
     size = image_path.stat().st_size
-    sha = hashlib.sha256(image_path.read_bytes()).hexdigest()
+    sha = _file_sha256(image_path)
     print(f"ROMFS image: {image_path.name} ({size} bytes, "
           f"{size * 100 // partition_bytes}% of the {partition_bytes // 1024} KB partition, "
           f"sha256 {sha[:12]}...)")
@@ -377,7 +646,208 @@ def _sync_ota_dev_marker(source_dir: Path, image_sha: str, port: str = None):
         print("    python tools/build.py flash --no-build --release   (clears /ota_dev)")
 
 
-def flash_device(source_dir: Path, port: str = None, repl: bool = False, release: bool = False):
+# mpremote's port shortcuts (`a0` -> /dev/ttyACM0 etc.), for matching a
+# --port value against `mpremote connect list` output.
+_PORT_SHORTCUTS = {'a': '/dev/ttyACM', 'u': '/dev/ttyUSB', 'c': 'COM'}
+_PICO_USB_VID = '2e8a:'
+
+
+def _list_ports() -> list:
+    """`mpremote connect list` rows, split into [device, serial, vid:pid, ...].
+
+    Listing never opens a port, so unlike any REPL command it cannot
+    interrupt a running or booting app. Empty if mpremote can't list.
+    """
+    try:
+        listing = subprocess.run(['mpremote', 'connect', 'list'], timeout=10,
+                                 capture_output=True, text=True)
+    except subprocess.TimeoutExpired:
+        return []
+    if listing.returncode != 0:
+        return []
+    return [row for row in (line.split() for line in listing.stdout.splitlines())
+            if len(row) >= 3]
+
+
+def _matching_ports(port: str = None) -> list:
+    """Rows for `port`, or for every Raspberry Pi (VID 2e8a) device if None."""
+    if port:
+        match = re.fullmatch(r'([auc])(\d+)', port)
+        if match:
+            port = _PORT_SHORTCUTS[match[1]] + match[2]
+        return [row for row in _list_ports() if row[0] == port]
+    return [row for row in _list_ports() if row[2].startswith(_PICO_USB_VID)]
+
+
+def _port_present(port: str = None) -> bool:
+    """Whether the device's serial port is currently enumerated."""
+    return bool(_matching_ports(port))
+
+
+# Runs in the safe-mode session: the board identity that keys the flash
+# manifest (hex, lower case).
+_DEVICE_ID_SNIPPET = ("import machine, binascii; "
+                      "print(binascii.hexlify(machine.unique_id()).decode())")
+
+
+def _device_id(port: str = None) -> str | None:
+    """machine.unique_id() of the board in safe mode, or None if unreadable."""
+    result = _mpremote(['exec', _DEVICE_ID_SNIPPET], port, timeout=8, quiet=True)
+    if result is None or result.returncode != 0:
+        return None
+    lines = result.stdout.decode(errors='replace').split()
+    if not lines or not re.fullmatch(r'[0-9a-f]+', lines[-1]):
+        return None
+    return lines[-1]
+
+
+def _forget_flash_manifests(device: str | None):
+    """Delete every flash manifest recorded for `device` (all of them if the
+    board couldn't be identified), whichever output dir wrote it."""
+    for path in build_cache.glob('*.flash-manifest.json'):
+        if device is None or _load_manifest(path).get('device') in (device, ''):
+            path.unlink(missing_ok=True)
+
+
+def _littlefs_files(source_dir: Path) -> dict:
+    """sha256 of every file a dev flash pushes, keyed by '/'-separated path."""
+    paths = [dir_entry.path for dir_entry in _walk(source_dir)]
+    return {
+        os.path.relpath(path, source_dir).replace(os.sep, '/'): digest
+        for path, digest in zip(paths, _hash_files(paths))
+    }
+
+
+# Files the app rewrites on the device (saved settings): a device copy that
+# differs from the build's is expected, so these are only re-pushed when
+# missing or when the build's copy changed since the last push.
+_DEVICE_MUTABLE_FILES = frozenset({'config.json'})
+
+# Runs in the safe-mode session: sha256 of each listed littlefs file as
+# "<hex> <path>", or "- <path>" when the file is missing.
+_DEVICE_HASH_SNIPPET = """import hashlib, binascii
+b = bytearray(1024)
+for p in {paths!r}:
+ try:
+  f = open(p, 'rb')
+ except OSError:
+  print('-', p)
+  continue
+ h = hashlib.sha256()
+ while True:
+  n = f.readinto(b)
+  if not n:
+   break
+  h.update(memoryview(b)[:n])
+ f.close()
+ print(binascii.hexlify(h.digest()).decode(), p)"""
+
+
+def _device_hashes(paths: list, port: str = None) -> dict | None:
+    """sha256 (None if missing) of each path as the device holds it now,
+    or None if the device couldn't be queried."""
+    result = _mpremote(['exec', _DEVICE_HASH_SNIPPET.format(paths=paths)],
+                       port, timeout=120, quiet=True)
+    if result is None or result.returncode != 0:
+        return None
+    hashes = {}
+    for line in result.stdout.decode(errors='replace').splitlines():
+        digest, _, rel = line.strip().partition(' ')
+        if rel in paths:
+            hashes[rel] = None if digest == '-' else digest
+    return hashes if len(hashes) == len(paths) else None
+
+
+def _littlefs_plan(source_dir: Path, files: dict, device: str | None,
+                   device_files: dict | None, full: bool = False) -> dict:
+    """Work out what a dev (littlefs) flash has to push.
+
+    `device_files` is what the board actually holds (_device_hashes), so a
+    file is copied whenever the device's copy is missing or differs —
+    whatever changed littlefs since the last flash (a release flash, another
+    checkout, mpremote or Thonny). Without it (`full`, or the board couldn't
+    be identified or queried) everything is copied.
+
+    The flash manifest records the sha256 of every file last pushed, and to
+    which board (machine.unique_id(), see _device_id). With one for this
+    board, files pushed before but gone from the build are removed, and
+    _DEVICE_MUTABLE_FILES are judged by the build's copy, so settings saved
+    on the device survive an incremental flash.
+    """
+    if full or not device or device_files is None:
+        return {'files': files, 'full': True, 'copy': sorted(files), 'remove': []}
+
+    previous = _load_manifest(_manifest_path(source_dir, 'flash'))
+    pushed = previous.get('files', {}) if previous.get('device') == device else {}
+    copy = sorted(
+        rel for rel, digest in files.items()
+        if device_files.get(rel) is None
+        or (pushed.get(rel) != digest if rel in _DEVICE_MUTABLE_FILES
+            else device_files[rel] != digest))
+    remove = sorted(rel for rel in pushed if rel not in files)
+    return {'files': files, 'full': False, 'copy': copy, 'remove': remove}
+
+
+def _parent_dirs(paths) -> set:
+    """Every directory (at any depth) holding one of the '/'-separated paths."""
+    dirs = set()
+    for rel in paths:
+        parts = rel.split('/')[:-1]
+        for depth in range(1, len(parts) + 1):
+            dirs.add('/'.join(parts[:depth]))
+    return dirs
+
+
+# Runs on the device before an incremental copy. Directories that already
+# exist and files already gone are both fine: a chained mpremote mkdir/rm
+# would abort the whole session on either.
+_LITTLEFS_PREPARE_SNIPPET = """import os
+for d in {dirs!r}:
+ try:
+  os.mkdir(d)
+ except OSError:
+  pass
+for f in {remove!r}:
+ try:
+  os.remove(f)
+ except OSError:
+  pass"""
+
+
+def _flash_littlefs(source_dir: Path, plan: dict, device: str | None,
+                    port: str = None) -> bool:
+    """Push a _littlefs_plan to the device in one mpremote session, then
+    record what the device now holds. Returns False if mpremote failed."""
+    if plan['full']:
+        args = ['cp', '-r', f'{source_dir.as_posix()}/.', ':']
+    elif plan['copy'] or plan['remove']:
+        print(f"Incremental flash: {len(plan['copy'])} changed, "
+              f"{len(plan['remove'])} removed")
+        args = []
+        # Parents sort before their children, so mkdir order is safe
+        dirs = sorted(_parent_dirs(plan['copy']))
+        if dirs or plan['remove']:
+            args += ['exec', _LITTLEFS_PREPARE_SNIPPET.format(dirs=dirs, remove=plan['remove']),
+                     '+']
+        for rel in plan['copy']:
+            args += ['cp', str(source_dir / rel), f':{rel}', '+']
+        args.pop()
+    else:
+        print("Device already up to date — nothing to copy.")
+        args = None
+
+    if args:
+        copy = _mpremote(args, port, timeout=600)
+        if copy is None or copy.returncode != 0:
+            return False
+
+    _write_manifest(_manifest_path(source_dir, 'flash'),
+                    {'device': device or '', 'files': plan['files']})
+    return True
+
+
+def flash_device(source_dir: Path, port: str = None, repl: bool = False, release: bool = False,
+                 full: bool = False):
     """Flash files to Pico using mpremote.
 
     Flashing into a *running* scoreboard is unreliable by design: with the
@@ -387,7 +857,9 @@ def flash_device(source_dir: Path, port: str = None, repl: bool = False, release
     firmware.
 
     Dev mode: everything goes to littlefs — fast iteration, and littlefs
-    shadows any ROMFS app. Release mode: the app ships as a ROMFS image
+    shadows any ROMFS app; only files the board is missing or holds a
+    different copy of are pushed unless `full` (see _littlefs_plan).
+    Release mode: the app ships as a ROMFS image
     (bytecode executes in place, ~100 KB less heap) with only
     main.py/config.json on littlefs. The caller resolves the default from
     build.config.json "flash_release" (see _resolve_deploy_release).
@@ -426,8 +898,16 @@ def flash_device(source_dir: Path, port: str = None, repl: bool = False, release
         # Remove littlefs copies so the ROMFS app actually runs (missing
         # paths are fine — already-release devices won't have them).
         print("Removing app files from littlefs (littlefs shadows /rom)...")
-        for target in _LITTLEFS_PURGE:
-            _mpremote(['rm', '-r', target], port, timeout=120, quiet=True)
+        purge = _mpremote(['exec', _LITTLEFS_PURGE_SNIPPET.format(targets=list(_LITTLEFS_PURGE))],
+                          port, timeout=120)
+        if purge is None or purge.returncode != 0:
+            raise SystemExit(
+                "Removing app files from littlefs failed or hung; the ROMFS app "
+                "would stay shadowed. Re-run: python tools/build.py flash --no-build --release"
+            )
+        # Whatever output dir they came from, this board's flash manifests
+        # no longer describe its littlefs
+        _forget_flash_manifests(_device_id(port))
 
         for name in _LITTLEFS_FILES:
             src = source_dir / name
@@ -448,8 +928,15 @@ def flash_device(source_dir: Path, port: str = None, repl: bool = False, release
         # whether this exact image is what the backend serves.
         _sync_ota_dev_marker(source_dir, image_sha, port)
     else:
-        copy = _mpremote(['cp', '-r', f'{source_dir.as_posix()}/.', ':'], port, timeout=600)
-        if copy is None or copy.returncode != 0:
+        files = _littlefs_files(source_dir)
+        device = _device_id(port)
+        device_files = None
+        if not full:
+            device_files = _device_hashes(sorted(files), port) if device else None
+            if device_files is None:
+                print("Could not identify or query the board; copying every file.")
+        plan = _littlefs_plan(source_dir, files, device, device_files, full)
+        if not _flash_littlefs(source_dir, plan, device, port):
             raise SystemExit(
                 "mpremote copy failed or hung. Use the Button A fallback above, "
                 "then re-run: python tools/build.py flash --no-build"
@@ -467,21 +954,45 @@ def flash_device(source_dir: Path, port: str = None, repl: bool = False, release
     _mpremote(['reset'], port, timeout=15, quiet=True)
 
     if repl:
-        # Wait for device to reconnect after reset
+        # Wait for device to reconnect after reset. Watch the USB port list
+        # only: any REPL probe (even `resume eval`) sends Ctrl-C first,
+        # which would KeyboardInterrupt the app that is just booting.
         print("Waiting for device to reconnect...")
-        time.sleep(2)
-
-        # Start REPL in separate command
-        repl_cmd = ['mpremote']
-        if port:
-            repl_cmd.extend(['connect', port, '+'])
-        repl_cmd.append('repl')
-        subprocess.run(repl_cmd)
+        _wait_for_port(port)
+        _open_repl(port)
     else:
         print("Flash complete!")
 
 
-def do_build(output_dir: Path, configuration: str, arch: str, no_assets: bool = False) -> bool:
+def _wait_for_port(port: str = None):
+    """Wait for the port to drop and re-enumerate after a hard reset.
+
+    Polls with backoff instead of a fixed sleep (most boards are back well
+    under a second); gives up after ~6 s and lets the caller try anyway.
+    """
+    # The reset drops USB almost immediately; don't mistake the old
+    # enumeration for the new one.
+    for _ in range(10):
+        if not _port_present(port):
+            break
+        time.sleep(0.1)
+    for delay in (0.1, 0.2, 0.4, 0.8, 1.6, 3.2):
+        time.sleep(delay)
+        if _port_present(port):
+            return
+
+
+def _open_repl(port: str = None):
+    """Attach an interactive mpremote REPL to the device."""
+    repl_cmd = ['mpremote']
+    if port:
+        repl_cmd.extend(['connect', port, '+'])
+    repl_cmd.append('repl')
+    subprocess.run(repl_cmd)
+
+
+def do_build(output_dir: Path, configuration: str, arch: str, no_assets: bool = False,
+             force_frontend: bool = False, clean: bool = False, verbose: bool = False) -> bool:
     """Execute the build pipeline."""
     # Regenerate layout/font modules from firmware/assets/ (source of truth)
     if not no_assets:
@@ -490,20 +1001,28 @@ def do_build(output_dir: Path, configuration: str, arch: str, no_assets: bool =
         print("Compiling font modules...")
         compile_fonts_all()
 
-    # Build frontend
-    if not build_frontend():
-        return False
-
-    # Clean and recreate output directory
-    if output_dir.exists():
+    # Reuse the output directory: process_firmware_files only rewrites what
+    # changed since the last build, and the sweep below deletes what no
+    # longer belongs. --clean restores the old wipe-and-rebuild.
+    if clean and output_dir.exists():
         shutil.rmtree(output_dir)
+        _manifest_path(output_dir, 'build').unlink(missing_ok=True)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Process firmware files (compile or copy)
-    process_firmware_files(output_dir, configuration, arch)
+    # Build the frontend (bun) and process firmware files (mpy-cross)
+    # side by side: only the final frontend copy depends on bun's output.
+    # Their progress lines may interleave.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        frontend = pool.submit(build_frontend, force_frontend)
+        firmware = pool.submit(process_firmware_files, output_dir, configuration, arch, verbose)
+        expected = firmware.result()
+        if not frontend.result():
+            return False
 
     # Copy frontend build output (overwrites source index.html.gz)
     copy_frontend_build(output_dir)
+    expected.add('index.html.gz')
+    _remove_stale_outputs(output_dir, expected)
 
     print(f"\nBuild complete: {output_dir.relative_to(root_directory)}/")
     return True
@@ -540,6 +1059,21 @@ def add_common_args(parser):
         action='store_true',
         help='Skip sprite/font regeneration (fast iteration when only firmware .py changed)'
     )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='List every compiled/copied firmware file, not just the totals'
+    )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help='Delete the output directory and rebuild everything instead of building incrementally'
+    )
+    parser.add_argument(
+        '--force-frontend',
+        action='store_true',
+        help='Run the bun frontend build even if its inputs are unchanged since the last build'
+    )
 
 
 def publish_app(output_dir: Path, deploy: bool) -> bool:
@@ -659,6 +1193,11 @@ def main():
         '--port',
         help='Serial port for flashing (auto-detect if not specified)'
     )
+    flash_parser.add_argument(
+        '--full-flash',
+        action='store_true',
+        help='Dev deploys: copy every file instead of only those changed since the last flash'
+    )
     _add_deploy_mode_args(flash_parser)
     add_common_args(flash_parser)
 
@@ -673,6 +1212,11 @@ def main():
         '--port',
         help='Serial port for flashing (auto-detect if not specified)'
     )
+    run_parser.add_argument(
+        '--full-flash',
+        action='store_true',
+        help='Dev deploys: copy every file instead of only those changed since the last flash'
+    )
     _add_deploy_mode_args(run_parser)
     add_common_args(run_parser)
 
@@ -695,7 +1239,8 @@ def main():
     if args.command == 'publish-app':
         output_dir = args.output if args.output.is_absolute() else root_directory / args.output
         if not args.no_build:
-            if not do_build(output_dir, args.configuration, args.arch, args.no_assets):
+            if not do_build(output_dir, args.configuration, args.arch, args.no_assets,
+                            args.force_frontend, args.clean, args.verbose):
                 return 1
         elif not output_dir.exists():
             print(f"Error: {output_dir} does not exist. Run build first or remove --no-build.")
@@ -707,32 +1252,37 @@ def main():
 
     # Default command (no subcommand) = build only
     if args.command is None:
-        if not do_build(output_dir, args.configuration, args.arch, args.no_assets):
+        if not do_build(output_dir, args.configuration, args.arch, args.no_assets,
+                        args.force_frontend, args.clean, args.verbose):
             return 1
         return 0
 
     # flash command
     elif args.command == 'flash':
         if not args.no_build:
-            if not do_build(output_dir, args.configuration, args.arch, args.no_assets):
+            if not do_build(output_dir, args.configuration, args.arch, args.no_assets,
+                            args.force_frontend, args.clean, args.verbose):
                 return 1
         elif not output_dir.exists():
             print(f"Error: {output_dir} does not exist. Run build first or remove --no-build.")
             return 1
 
-        flash_device(output_dir, args.port, repl=False, release=_resolve_deploy_release(args))
+        flash_device(output_dir, args.port, repl=False, release=_resolve_deploy_release(args),
+                     full=args.full_flash)
         return 0
 
     # run command
     elif args.command == 'run':
         if not args.no_build:
-            if not do_build(output_dir, args.configuration, args.arch, args.no_assets):
+            if not do_build(output_dir, args.configuration, args.arch, args.no_assets,
+                            args.force_frontend, args.clean, args.verbose):
                 return 1
         elif not output_dir.exists():
             print(f"Error: {output_dir} does not exist. Run build first or remove --no-build.")
             return 1
 
-        flash_device(output_dir, args.port, repl=True, release=_resolve_deploy_release(args))
+        flash_device(output_dir, args.port, repl=True, release=_resolve_deploy_release(args),
+                     full=args.full_flash)
         return 0
 
     return 0